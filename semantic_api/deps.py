@@ -4,15 +4,27 @@ import logging
 from functools import lru_cache
 
 from typing import Literal
-from fastapi import Depends
-from qdrant_client import QdrantClient
 
+import httpx
+from fastapi import Depends
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from semantic_core.embeddings.base import Embedder
+from semantic_core.embeddings.cache import (
+    CachedEmbedder,
+    DiskEmbeddingCache,
+    EmbeddingCache,
+    FIFOEmbeddingCache,
+    LRUEmbeddingCache,
+)
+from semantic_core.embeddings.fastembed import FastEmbedEmbeddings
 from semantic_core.embeddings.gemini import GeminiEmbeddings
 from semantic_core.ingest.normalizer import DocumentNormalizer
 from semantic_core.pipelines.searcher import SearchPipeline
 from semantic_core.pipelines.indexer import IndexPipeline
 from semantic_core.vectorstores.base import VectorStore
 from semantic_core.vectorstores.faiss_store import FaissVectorStore
+from semantic_api.jobs import IndexJobRegistry
 from semantic_core.chunking.base import Chunker, build_default_chunker
 from semantic_core.vectorstores.pgvector_store import PgVectorStore
 from semantic_core.vectorstores.qdrant_store import QDrantVectorStore
@@ -21,9 +33,116 @@ logger = logging.getLogger(__name__)
 
 
 @lru_cache
-def get_embeddings() -> GeminiEmbeddings:
-    # TODO: Switch case of embedding models. Gemini by default
-    return GeminiEmbeddings()
+def get_http_client() -> httpx.Client:
+    """
+    Process-wide pooled HTTP/2 client for outbound API calls (Gemini).
+
+    Shared so embedding requests reuse warm TLS connections; closed by
+    `close_http_client()` on application shutdown.
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=64),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+        get_http_client.cache_clear()
+
+
+@lru_cache
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Async counterpart of `get_http_client()`, used by async embedding calls
+    so concurrent batches share one HTTP/2 connection pool.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=64),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async HTTP client, if one was created."""
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
+        get_async_http_client.cache_clear()
+
+
+def _create_embedding_cache() -> EmbeddingCache | None:
+    """
+    Build the embedding cache policy.
+
+    Configuration via environment variables:
+    - EMBEDDINGS_CACHE: lru (default), fifo, disk, or none
+    - EMBEDDINGS_CACHE_SIZE: Max entries for lru/fifo (default: 2048). Each
+      entry costs 4 bytes per dimension (about 3 KB at 768 dimensions, so
+      ~6 MB by default) in every worker process.
+    - EMBEDDINGS_CACHE_DIR: Directory for the disk cache (default: .embed_cache)
+    """
+    policy = os.getenv("EMBEDDINGS_CACHE", "lru").lower()
+    maxsize = int(os.getenv("EMBEDDINGS_CACHE_SIZE", "2048"))
+
+    if policy == "none":
+        return None
+    elif policy == "lru":
+        return LRUEmbeddingCache(maxsize=maxsize)
+    elif policy == "fifo":
+        return FIFOEmbeddingCache(maxsize=maxsize)
+    elif policy == "disk":
+        return DiskEmbeddingCache(os.getenv("EMBEDDINGS_CACHE_DIR", ".embed_cache"))
+    else:
+        raise ValueError(
+            f"Unsupported embeddings cache policy: {policy}. "
+            f"Supported policies: lru, fifo, disk, none"
+        )
+
+
+def _create_embedder() -> Embedder:
+    """
+    Create the configured embedding backend.
+
+    Configuration via environment variables:
+    - EMBEDDINGS_BACKEND: gemini (default) or fastembed
+    - FASTEMBED_MODEL: FastEmbed model name (default: BAAI/bge-small-en-v1.5)
+    - FASTEMBED_CACHE_DIR: Optional directory for downloaded ONNX models
+    """
+    backend = os.getenv("EMBEDDINGS_BACKEND", "gemini").lower()
+
+    logger.info(f"Initializing embeddings backend: {backend}")
+
+    if backend == "gemini":
+        return GeminiEmbeddings(
+            http_client=get_http_client(),
+            async_http_client=get_async_http_client(),
+        )
+    elif backend == "fastembed":
+        return FastEmbedEmbeddings(
+            model_name=os.getenv("FASTEMBED_MODEL", "BAAI/bge-small-en-v1.5"),
+            cache_dir=os.getenv("FASTEMBED_CACHE_DIR"),
+        )
+    else:
+        raise ValueError(
+            f"Unsupported embeddings backend: {backend}. "
+            f"Supported backends: gemini, fastembed"
+        )
+
+
+@lru_cache
+def get_embeddings() -> Embedder:
+    embedder = _create_embedder()
+
+    cache = _create_embedding_cache()
+    if cache is None:
+        return embedder
+
+    logger.info(f"Caching embeddings with {type(cache).__name__}")
+    return CachedEmbedder(embedder, cache=cache)
 
 
 @lru_cache
@@ -34,6 +153,22 @@ def get_chunker() -> Chunker:
 VectorStoreType = Literal["qdrant", "faiss", "pgvector"]
 
 
+def _qdrant_transport() -> dict:
+    """
+    Transport options shared by the sync and async Qdrant clients. gRPC
+    sends vectors as binary floats rather than JSON text.
+
+    Explicit REST pool limits keep connections alive between requests;
+    without them qdrant-client disables keep-alive for localhost servers,
+    paying a TCP handshake on every call.
+    """
+    return {
+        "prefer_grpc": os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true",
+        "grpc_port": int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+        "limits": httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    }
+
+
 @lru_cache
 def get_qdrant_client() -> QdrantClient:
     """
@@ -45,6 +180,8 @@ def get_qdrant_client() -> QdrantClient:
     - QDRANT_API_KEY: Optional API key for authentication
     - QDRANT_CLUSTER_URL: Full URL (alternative to host/port)
     - QDRANT_IN_MEMORY: Use in-memory mode for testing (default: false)
+    - QDRANT_PREFER_GRPC: Use gRPC instead of REST (default: true)
+    - QDRANT_GRPC_PORT: Qdrant gRPC port (default: 6334)
     """
     use_memory = os.getenv("QDRANT_IN_MEMORY", "false").lower() == "true"
 
@@ -57,7 +194,7 @@ def get_qdrant_client() -> QdrantClient:
     if qdrant_url:
         api_key = os.getenv("QDRANT_API_KEY")
         logger.info(f"\nConnecting to Qdrant at URL: {qdrant_url}\n")
-        return QdrantClient(url=qdrant_url, api_key=api_key)
+        return QdrantClient(url=qdrant_url, api_key=api_key, **_qdrant_transport())
 
     # Fall back to host/port configuration
     host = os.getenv("QDRANT_HOST", "localhost")
@@ -65,13 +202,78 @@ def get_qdrant_client() -> QdrantClient:
     api_key = os.getenv("QDRANT_API_KEY")
 
     logger.info(f"Connecting to Qdrant at {host}:{port}")
-    return QdrantClient(host=host, port=port, api_key=api_key, timeout=60)
+    return QdrantClient(
+        host=host, port=port, api_key=api_key, timeout=60, **_qdrant_transport()
+    )
+
+
+@lru_cache
+def get_async_qdrant_client() -> AsyncQdrantClient | None:
+    """
+    Async client for the same Qdrant server as `get_qdrant_client()`.
+
+    Returns None in in-memory mode, where a second client would see a
+    separate, empty database; the store then falls back to the sync client.
+    """
+    if os.getenv("QDRANT_IN_MEMORY", "false").lower() == "true":
+        return None
+
+    api_key = os.getenv("QDRANT_API_KEY")
+    qdrant_url = os.getenv("QDRANT_CLUSTER_URL")
+    if qdrant_url:
+        return AsyncQdrantClient(
+            url=qdrant_url, api_key=api_key, **_qdrant_transport()
+        )
+
+    host = os.getenv("QDRANT_HOST", "localhost")
+    port = int(os.getenv("QDRANT_PORT", "6333"))
+    return AsyncQdrantClient(
+        host=host, port=port, api_key=api_key, timeout=60, **_qdrant_transport()
+    )
+
+
+async def close_async_qdrant_client() -> None:
+    """Close the shared async Qdrant client, if one was created."""
+    if get_async_qdrant_client.cache_info().currsize:
+        client = get_async_qdrant_client()
+        if client is not None:
+            await client.close()
+        get_async_qdrant_client.cache_clear()
 
 
 def _create_qdrant_store() -> QDrantVectorStore:
-    """Create and return a Qdrant vector store instance."""
+    """
+    Create and return a Qdrant vector store instance.
+
+    Configuration via environment variables:
+    - QDRANT_VECTOR_DATATYPE: float32 (default) or float16 storage for new
+      collections
+    - QDRANT_UPLOAD_PARALLEL: Worker processes for bulk uploads (default: 1)
+    - QDRANT_QUANTIZATION: none (default), scalar (int8) or binary, for new
+      collections
+    - QDRANT_QUERY_CACHE_SIZE: LSH buckets of cached query results per
+      process (default: 0, disabled). Only this process's writes
+      invalidate it; writes from other workers show up after the TTL.
+    - QDRANT_QUERY_CACHE_THRESHOLD: Cosine similarity needed to reuse a
+      cached result (default: 0.97)
+    - QDRANT_QUERY_CACHE_TTL: Seconds a cached result is served
+      (default: 60; 0 never expires)
+    - QDRANT_PAYLOAD_INDEXES: Metadata filter keys to index as key:schema
+      pairs, e.g. "product:keyword,page_number:integer" (default: none)
+    """
     client = get_qdrant_client()
     collection_name = os.getenv("QDRANT_COLLECTION_NAME", "semantic_chunks")
+    vector_datatype = os.getenv("QDRANT_VECTOR_DATATYPE", "float32").lower()
+    parallel = int(os.getenv("QDRANT_UPLOAD_PARALLEL", "1"))
+    quantization = os.getenv("QDRANT_QUANTIZATION", "none").lower()
+    query_cache_size = int(os.getenv("QDRANT_QUERY_CACHE_SIZE", "0"))
+    query_cache_threshold = float(os.getenv("QDRANT_QUERY_CACHE_THRESHOLD", "0.97"))
+    query_cache_ttl = float(os.getenv("QDRANT_QUERY_CACHE_TTL", "60")) or None
+    payload_indexes = dict(
+        item.split(":", 1)
+        for item in os.getenv("QDRANT_PAYLOAD_INDEXES", "").split(",")
+        if item.strip()
+    )
     embeddings = get_embeddings()
 
     logger.info(f"Creating Qdrant vector store with collection: {collection_name}")
@@ -80,6 +282,14 @@ def _create_qdrant_store() -> QDrantVectorStore:
         collection_name=collection_name,
         embedding_model=embeddings,
         vector_size=None,
+        vector_datatype=vector_datatype,
+        parallel=parallel,
+        async_client=get_async_qdrant_client(),
+        quantization=quantization,
+        query_cache_size=query_cache_size,
+        query_cache_threshold=query_cache_threshold,
+        query_cache_ttl=query_cache_ttl,
+        payload_index_fields=payload_indexes,
     )
 
 
@@ -101,15 +311,24 @@ def get_vector_store() -> VectorStore:
     Qdrant:
     - QDRANT_URL or QDRANT_HOST/QDRANT_PORT
     - QDRANT_API_KEY (optional)
+    - QDRANT_PREFER_GRPC (default: true), QDRANT_GRPC_PORT (default: 6334)
     - QDRANT_COLLECTION_NAME (default: semantic_chunks)
     - QDRANT_IN_MEMORY (default: false)
+    - QDRANT_VECTOR_DATATYPE (default: float32)
+    - QDRANT_UPLOAD_PARALLEL (default: 1)
+    - QDRANT_QUANTIZATION (default: none; scalar or binary)
+    - QDRANT_QUERY_CACHE_SIZE (default: 0, disabled),
+      QDRANT_QUERY_CACHE_THRESHOLD (default: 0.97),
+      QDRANT_QUERY_CACHE_TTL (default: 60)
+    - QDRANT_PAYLOAD_INDEXES (default: none)
 
     FAISS:
-    - No additional configuration needed
+    - FAISS_QUANTIZATION (default: none; fp16 or int8)
 
     PgVector:
     - PGVECTOR_CONNECTION_STRING or PGVECTOR_HOST/PORT/DATABASE/USER/PASSWORD
     - PGVECTOR_TABLE_NAME (default: embeddings)
+    - PGVECTOR_VECTOR_TYPE (default: vector)
 
     Returns:
         VectorStore: Configured vector store instance
@@ -146,6 +365,7 @@ def _create_pgvector_store() -> PgVectorStore:
     - PGVECTOR_USER: Database user (default: postgres)
     - PGVECTOR_PASSWORD: Database password
     - PGVECTOR_TABLE_NAME: Table name for vectors (default: embeddings)
+    - PGVECTOR_VECTOR_TYPE: vector (default) or halfvec (float16, pgvector >= 0.7)
     """
     # Try full connection string first
     connection_string = os.getenv("PGVECTOR_CONNECTION_STRING")
@@ -161,6 +381,7 @@ def _create_pgvector_store() -> PgVectorStore:
         connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
     table_name = os.getenv("PGVECTOR_TABLE_NAME", "embeddings")
+    vector_type = os.getenv("PGVECTOR_VECTOR_TYPE", "vector").lower()
     embeddings = get_embeddings()
 
     logger.info(f"Creating PgVector store with table: {table_name}")
@@ -168,13 +389,15 @@ def _create_pgvector_store() -> PgVectorStore:
         connection_string=connection_string,
         table_name=table_name,
         embedding_model=embeddings,
+        vector_type=vector_type,
     )
 
 
 def _create_faiss_store() -> FaissVectorStore:
     """Create and return a FAISS vector store instance."""
-    logger.info("Creating FAISS vector store")
-    return FaissVectorStore()
+    quantization = os.getenv("FAISS_QUANTIZATION", "none").lower()
+    logger.info("Creating FAISS vector store (quantization=%s)", quantization)
+    return FaissVectorStore(quantization=quantization)
 
 
 # Helper function to clear the cache and reinitialize
@@ -185,25 +408,44 @@ def reset_vector_store() -> None:
     """
     get_vector_store.cache_clear()
     get_qdrant_client.cache_clear()
+    get_async_qdrant_client.cache_clear()
+    reset_pipelines()
     logger.info("Vector store cache cleared")
 
 
+def reset_pipelines() -> None:
+    """
+    Clear the cached pipelines so the next request rebuilds them from the
+    current embedder, chunker and vector store.
+    """
+    get_search_pipeline.cache_clear()
+    get_index_pipeline.cache_clear()
+
+
 def get_document_normalizer() -> DocumentNormalizer:
     return DocumentNormalizer()
 
 
+@lru_cache
+def get_job_registry() -> IndexJobRegistry:
+    return IndexJobRegistry()
+
+
 # ------- PIPELINES -------
 
 
+@lru_cache
 def get_search_pipeline() -> SearchPipeline:
     embedder = get_embeddings()
     vector_store = get_vector_store()
     return SearchPipeline(embedder=embedder, store=vector_store)
 
 
+@lru_cache
 def get_index_pipeline() -> IndexPipeline:
     """
     Build the default indexing pipeline with the configured vector store.
+    Built once per process; the pipeline holds no per-request state.
 
     The vector store type is determined by the VECTOR_STORE_TYPE environment
     variable (default: qdrant).
@@ -213,7 +455,7 @@ def get_index_pipeline() -> IndexPipeline:
     store = get_vector_store()
     metadata = {"source": "semantic_api"}
 
-    logger.info(f"\nIndex pipeline created with {type(store).__name__}\n")
+    logger.info("Index pipeline created with %s", type(store).__name__)
 
     return IndexPipeline(
         chunker=chunker, embedder=embedder, store=store, metadata=metadata
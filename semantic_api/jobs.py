@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from semantic_core.models import NormalizedDocument
+from semantic_core.pipelines.indexer import IndexPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class IndexJobRegistry:
+    """
+    In-memory, per-process record of background indexing jobs keyed by doc_id.
+
+    Only the most recent `max_jobs` entries are kept.
+    """
+
+    def __init__(self, max_jobs: int = 10_000) -> None:
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set(
+        self,
+        doc_id: str,
+        status: str,
+        *,
+        chunks: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._jobs[doc_id] = {
+                "doc_id": doc_id,
+                "status": status,
+                "chunks": chunks,
+                "error": error,
+            }
+            self._jobs.move_to_end(doc_id)
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(doc_id)
+            return dict(job) if job else None
+
+
+async def run_index_job(
+    pipeline: IndexPipeline, doc: NormalizedDocument, jobs: IndexJobRegistry
+) -> None:
+    """
+    Index a document with the streaming pipeline and record the outcome.
+    """
+    doc_id = doc.ref.doc_id
+    jobs.set(doc_id, "indexing")
+    try:
+        n_chunks = await pipeline.aindex(doc)
+    except Exception as e:
+        logger.exception("Indexing failed for %s", doc_id)
+        jobs.set(doc_id, "failed", error=str(e))
+        return
+    jobs.set(doc_id, "indexed", chunks=n_chunks)
@@ -1,14 +1,87 @@
 from __future__ import annotations
+import asyncio
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
+from semantic_api.deps import (
+    close_async_http_client,
+    close_async_qdrant_client,
+    close_http_client,
+    get_embeddings,
+    get_http_client,
+    get_vector_store,
+)
 from semantic_api.routes import documents, search
+from semantic_core.models import SearchQuery
 
 load_dotenv()
 
-app = FastAPI(title="Semantic Service API")
+logger = logging.getLogger(__name__)
+
+
+def _warm_up() -> None:
+    """
+    Build the shared embedder and vector store and exercise both once, so
+    model initialisation and connection setup happen before the first
+    request rather than during it.
+
+    The lru_cached getters in `semantic_api.deps` (`get_embeddings()`,
+    `get_vector_store()`, ...) are the process-wide singletons that route
+    dependencies resolve, so warming them here is all that is needed.
+
+    Disable with WARMUP_ON_STARTUP=false.
+    """
+    embedder = get_embeddings()
+
+    if os.getenv("WARMUP_ON_STARTUP", "true").lower() != "true":
+        return
+
+    try:
+        qvec = embedder.embed_texts(["warmup"])[0]
+        store = get_vector_store()
+        store.query(qvec, SearchQuery(query="warmup", top_k=1))
+    except Exception as e:
+        logger.warning("Startup warm-up failed, continuing lazily: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Process-wide startup/shutdown hooks.
+
+    Installs a bounded default executor so blocking work offloaded with
+    `asyncio.to_thread` (file parsing, embedding, vector store I/O) never
+    runs on the event loop itself, opens the shared outbound HTTP client,
+    then warms the embedder and vector store so the first request does not
+    pay for their initialisation.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="semantic-io"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    get_http_client()
+    await asyncio.to_thread(_warm_up)
+    try:
+        yield
+    finally:
+        close_http_client()
+        await close_async_http_client()
+        await close_async_qdrant_client()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(
+    title="Semantic Service API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 @app.get("/health", tags=["system"])
@@ -18,3 +91,19 @@ async def health() -> dict:
 
 app.include_router(documents.router)
 app.include_router(search.router)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard]. Job status and the
+    # FAISS store are per-process, so scale out with WEB_CONCURRENCY only
+    # when using a shared vector store.
+    uvicorn.run(
+        "semantic_api.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
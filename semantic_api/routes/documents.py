@@ -3,8 +3,10 @@ from datetime import datetime
 import logging
 from typing import Any, Optional
 
+import orjson
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Body,
     Depends,
     File,
@@ -14,11 +16,18 @@ from fastapi import (
     status,
 )
 
-from semantic_api.deps import get_document_normalizer, get_index_pipeline
-from semantic_api.schemas import IngestRequest, IngestResponse
+from semantic_api.deps import (
+    get_document_normalizer,
+    get_index_pipeline,
+    get_job_registry,
+)
+from semantic_api.jobs import IndexJobRegistry, run_index_job
+from semantic_api.schemas import IngestRequest, IngestResponse, IngestStatusResponse
 from semantic_core.ingest.normalizer import DocumentNormalizer
 from semantic_core.pipelines.indexer import IndexPipeline
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/v1/documents", tags=["documents"])
 
 
@@ -26,6 +35,7 @@ router = APIRouter(prefix="/v1/documents", tags=["documents"])
     "/ingest", response_model=IngestResponse, status_code=status.HTTP_202_ACCEPTED
 )
 async def ingest_document(
+    background: BackgroundTasks,
     payload: Optional[IngestRequest] = Body(default=None),
     source: Optional[str] = Form(default=None),
     doc_type: Optional[str] = Form(default=None),
@@ -36,7 +46,14 @@ async def ingest_document(
     file: Optional[UploadFile] = File(default=None),
     pipeline: IndexPipeline = Depends(get_index_pipeline),
     normalizer: DocumentNormalizer = Depends(get_document_normalizer),
+    jobs: IndexJobRegistry = Depends(get_job_registry),
 ) -> IngestResponse:
+    """
+    Normalize the document and queue it for indexing.
+
+    Responds as soon as the checksum is known; chunking, embedding and
+    storage run in the background. Poll `GET /{doc_id}/status` for progress.
+    """
 
     if payload is None:
         # Multipart mode validation
@@ -48,10 +65,8 @@ async def ingest_document(
 
         meta_dict: dict[str, Any] = {}
         if metadata:
-            import json as _json
-
             try:
-                meta_dict = _json.loads(metadata)
+                meta_dict = orjson.loads(metadata)
                 if not isinstance(meta_dict, dict):
                     raise ValueError("metadata must be a JSON object")
             except Exception as e:
@@ -68,15 +83,34 @@ async def ingest_document(
             metadata=meta_dict,
         )
 
-        logging.info("Received multipart ingest request: %s", payload)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "ingest payload: source=%s doc_type=%s product=%s chars=%d",
+            payload.source,
+            payload.doc_type,
+            payload.product,
+            len(payload.raw_text or payload.json_text or ""),
+        )
 
     normalized = await normalizer.normalize_from_request(payload, upload_file=file)
 
-    try:
-        n_chunks = pipeline.index(normalized)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Indexing failed: {e}") from e
+    jobs.set(normalized.ref.doc_id, "queued")
+    background.add_task(run_index_job, pipeline, normalized, jobs)
 
     return IngestResponse(
         doc_id=normalized.ref.doc_id, checksum=normalized.ref.checksum
     )
+
+
+@router.get("/{doc_id}/status", response_model=IngestStatusResponse)
+async def ingest_status(
+    doc_id: str,
+    jobs: IndexJobRegistry = Depends(get_job_registry),
+) -> IngestStatusResponse:
+    """
+    Report the indexing state of a previously ingested document.
+    """
+    job = jobs.get(doc_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown doc_id: {doc_id}")
+    return IngestStatusResponse(**job)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends
 
 from semantic_api.deps import get_search_pipeline
@@ -16,5 +18,9 @@ async def search(
 ) -> list[SearchResult]:
     """
     Run a semantic search over indexed content.
+
+    Embedding the query and searching the store block, so they run in a
+    worker thread to keep the event loop free for other requests and
+    background ingest jobs.
     """
-    return pipeline.search(query)
+    return await asyncio.to_thread(pipeline.search, query)
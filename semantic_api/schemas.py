@@ -28,6 +28,17 @@ class IngestRequest(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+IndexStatus = Literal["queued", "indexing", "indexed", "failed"]
+
+
 class IngestResponse(BaseModel):
     doc_id: str
     checksum: str
+    status: IndexStatus = "queued"
+
+
+class IngestStatusResponse(BaseModel):
+    doc_id: str
+    status: IndexStatus
+    chunks: Optional[int] = None
+    error: Optional[str] = None
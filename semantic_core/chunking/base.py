@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Protocol
 
+import orjson
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from semantic_core.models import NormalizedDocument
@@ -20,19 +23,66 @@ class Chunker(Protocol):
         self,
         doc: NormalizedDocument,
         *,
-        base_metadata: Dict[str, Any],
+        base_metadata: Mapping[str, Any],
     ) -> List[Chunk]: ...
 
 
 def _chunk_id(*parts: str) -> str:
-    """Stable chunk id from deterministic parts."""
+    """Stable chunk id from deterministic parts (BLAKE2b-128, 32 hex chars)."""
     raw = "|".join(parts)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
 
 
-def _merge_meta(base_metadata: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
-    # Ensure base metadata never gets mutated.
-    return {**base_metadata, **extra}
+def _common_meta(
+    base_metadata: Mapping[str, Any], doc: NormalizedDocument, **extra: Any
+) -> Dict[str, Any]:
+    """
+    Metadata shared by every chunk of a document, built once per document.
+    Chunks copy it and add their own keys, so base metadata is never mutated.
+    The document checksum is always included so stores can detect re-ingests.
+    """
+    return {
+        **base_metadata,
+        "doc_type": doc.ref.doc_type,
+        "checksum": doc.ref.checksum,
+        **extra,
+    }
+
+
+# Integer literals this long may not fit in 64 bits, which orjson would
+# parse as a lossy float.
+_WIDE_INT = re.compile(r"[0-9]{19,}")
+
+
+def _load_json(raw: str) -> Any:
+    """
+    Parse JSON text with orjson, or with the stdlib parser for input orjson
+    rejects (NaN/Infinity, lone surrogates) or would alter (integers wider
+    than 64 bits). Raises ValueError if neither accepts it.
+    """
+    if _WIDE_INT.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+_DEFAULT_SEPARATORS = ("\n\n", "\n", ". ", " ", "")
+
+
+@lru_cache(maxsize=16)
+def _get_splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    separators: tuple[str, ...] = _DEFAULT_SEPARATORS,
+) -> RecursiveCharacterTextSplitter:
+    """Shared splitter per configuration; splitting itself is stateless."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=list(separators),
+    )
 
 
 @dataclass
@@ -44,55 +94,139 @@ class TextChunker:
     chunk_size: int = 1200
     chunk_overlap: int = 150
 
-    def __post_init__(self) -> None:
-        self._splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""],
-        )
+    def split(self, text: str) -> List[str]:
+        """Split raw text into chunk-sized pieces."""
+        return _get_splitter(self.chunk_size, self.chunk_overlap).split_text(text)
 
     def chunk(
-        self, doc: NormalizedDocument, *, base_metadata: Dict[str, Any]
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
     ) -> List[Chunk]:
-        pieces = self._splitter.split_text(doc.text or "")
-        out: List[Chunk] = []
+        pieces = self.split(doc.text or "")
+        common = _common_meta(base_metadata, doc)
 
         # We don't have accurate char offsets from LangChain splitter without extra work,
         # but we can still provide chunk_index and stable ids.
-        for i, text in enumerate(pieces):
-            out.append(
-                Chunk(
-                    chunk_id=_chunk_id(doc.ref.checksum, f"t{i}"),
-                    doc_id=doc.ref.doc_id,
-                    text=text,
-                    metadata=_merge_meta(
-                        base_metadata,
-                        {"chunk_index": i, "doc_type": doc.ref.doc_type},
-                    ),
-                    # start_char/end_char optional (unknown here)
-                )
+        return [
+            Chunk(
+                chunk_id=_chunk_id(doc.ref.checksum, f"t{i}"),
+                doc_id=doc.ref.doc_id,
+                text=text,
+                metadata={**common, "chunk_index": i},
+                # start_char/end_char optional (unknown here)
             )
+            for i, text in enumerate(pieces)
+        ]
+
+
+@dataclass
+class FastTextChunker(TextChunker):
+    """
+    Greedy plain-text chunker built on `str.rfind`, for txt/raw/csv.
+
+    Each chunk ends at the last separator (in priority order) that fits in
+    `chunk_size` without leaving the chunk less than half full; the next
+    one starts `chunk_overlap` characters earlier, snapped forward to a
+    word boundary. Known offsets are kept as start_char/end_char.
+    """
+
+    separators: tuple[str, ...] = _DEFAULT_SEPARATORS
+
+    def spans(self, text: str) -> List[tuple[int, int]]:
+        """Return (start, end) offsets of each chunk, whitespace-trimmed."""
+        size = self.chunk_size
+        overlap = min(self.chunk_overlap, size - 1)
+        n = len(text)
+        out: List[tuple[int, int]] = []
+
+        start = 0
+        while start < n:
+            limit = start + size
+            if limit >= n:
+                end = n
+            else:
+                end = self._cut(text, start, limit)
+
+            lo, hi = start, end
+            while lo < hi and text[lo].isspace():
+                lo += 1
+            while hi > lo and text[hi - 1].isspace():
+                hi -= 1
+            if lo < hi:
+                out.append((lo, hi))
+
+            if end >= n:
+                break
+            nxt = end - overlap
+            if overlap:
+                space = text.find(" ", nxt, end)
+                if space != -1:
+                    nxt = space + 1
+            start = nxt if nxt > start else end
         return out
 
+    def _cut(self, text: str, start: int, limit: int) -> int:
+        """
+        Pick the chunk end: the highest-priority separator in the back half
+        of the window, else the best separator anywhere, else a hard cut.
+        """
+        half = start + (limit - start) // 2
+        fallback = limit
+        for sep in self.separators:
+            if not sep:
+                break
+            pos = text.rfind(sep, start, limit)
+            if pos >= half:
+                return pos + len(sep)
+            if pos > start and fallback == limit:
+                fallback = pos + len(sep)
+        return fallback
+
+    def split(self, text: str) -> List[str]:
+        """Split raw text into chunk-sized pieces."""
+        return [text[s:e] for s, e in self.spans(text)]
+
+    def chunk(
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
+    ) -> List[Chunk]:
+        text = doc.text or ""
+        common = _common_meta(base_metadata, doc)
+        return [
+            Chunk(
+                chunk_id=_chunk_id(doc.ref.checksum, f"t{i}"),
+                doc_id=doc.ref.doc_id,
+                text=text[s:e],
+                metadata={**common, "chunk_index": i},
+                start_char=s,
+                end_char=e,
+            )
+            for i, (s, e) in enumerate(self.spans(text))
+        ]
+
 
 def _flatten_json(obj: Any, prefix: str = "") -> List[tuple[str, str]]:
     """
     Flatten JSON into path:value lines.
     Example: {"a":{"b":2}} -> [("a.b","2")]
+
+    Walks the tree with an explicit stack (children pushed in reverse so
+    output keeps document order) and appends into a single list.
     """
     items: List[tuple[str, str]] = []
-
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            path = f"{prefix}.{k}" if prefix else str(k)
-            items.extend(_flatten_json(v, path))
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            path = f"{prefix}[{i}]"
-            items.extend(_flatten_json(v, path))
-    else:
-        if prefix:
-            items.append((prefix, "" if obj is None else str(obj)))
+    stack: List[tuple[str, Any]] = [(prefix, obj)]
+
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(
+                (f"{path}.{k}" if path else str(k), v)
+                for k, v in reversed(node.items())
+            )
+        elif isinstance(node, list):
+            stack.extend(
+                (f"{path}[{i}]", node[i]) for i in range(len(node) - 1, -1, -1)
+            )
+        elif path:
+            items.append((path, "" if node is None else str(node)))
     return items
 
 
@@ -106,38 +240,64 @@ class JsonChunker:
     text_chunker: TextChunker
 
     def chunk(
-        self, doc: NormalizedDocument, *, base_metadata: Dict[str, Any]
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
     ) -> List[Chunk]:
         raw = doc.text or ""
         try:
-            obj = json.loads(raw)
-        except Exception:
+            obj = _load_json(raw)
+        except ValueError:
             # If not valid JSON, treat as plain text.
             return self.text_chunker.chunk(doc, base_metadata=base_metadata)
 
-        lines: List[str] = []
-        for path, value in _flatten_json(obj):
-            if value.strip():
-                lines.append(f"{path}: {value}")
-
-        flattened = "\n".join(lines).strip()
-        proxy = NormalizedDocument(ref=doc.ref, text=flattened, pages=None)
-
-        chunks = self.text_chunker.chunk(proxy, base_metadata=base_metadata)
+        flattened = "\n".join(
+            f"{path}: {value}" for path, value in _flatten_json(obj) if value.strip()
+        ).strip()
+        common = _common_meta(base_metadata, doc, json_flattened=True)
         return [
             Chunk(
                 chunk_id=_chunk_id(doc.ref.checksum, f"j{i}"),
-                doc_id=c.doc_id,
-                text=c.text,
-                metadata=_merge_meta(c.metadata, {"json_flattened": True}),
-                page_number=c.page_number,
-                start_char=c.start_char,
-                end_char=c.end_char,
+                doc_id=doc.ref.doc_id,
+                text=piece,
+                metadata={**common, "chunk_index": i},
             )
-            for i, c in enumerate(chunks)
+            for i, piece in enumerate(self.text_chunker.split(flattened))
         ]
 
 
+_HTML_SKIP_TAGS = ("script", "style", "noscript")
+_HTML_BLOCK_TAGS = ("h1", "h2", "h3", "p", "li")
+_HTML_HEADING_TAGS = ("h1", "h2", "h3")
+
+
+def _html_blocks(html: str) -> List[tuple[str, str]]:
+    """
+    Extract (tag, visible text) pairs for content blocks in document order.
+
+    Uses selectolax's C-based lexbor parser when installed, otherwise
+    BeautifulSoup with the pure-Python html.parser.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup(list(_HTML_SKIP_TAGS)):
+            tag.decompose()
+        return [
+            (el.name, el.get_text(" ", strip=True))
+            for el in soup.find_all(list(_HTML_BLOCK_TAGS))
+        ]
+
+    tree = LexborHTMLParser(html)
+    for node in tree.css(",".join(_HTML_SKIP_TAGS)):
+        node.decompose()
+    return [
+        (el.tag, el.text(separator=" ", strip=True))
+        for el in tree.css(",".join(_HTML_BLOCK_TAGS))
+    ]
+
+
 @dataclass
 class HtmlChunker:
     """
@@ -147,41 +307,27 @@ class HtmlChunker:
     text_chunker: TextChunker
 
     def chunk(
-        self, doc: NormalizedDocument, *, base_metadata: Dict[str, Any]
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
     ) -> List[Chunk]:
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(doc.text or "", "html.parser")
-
-        # Remove common non-content tags
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-
         blocks: List[str] = []
-        for el in soup.find_all(["h1", "h2", "h3", "p", "li"]):
-            t = el.get_text(" ", strip=True)
+        for tag, t in _html_blocks(doc.text or ""):
             if not t:
                 continue
-            if el.name in ("h1", "h2", "h3"):
+            if tag in _HTML_HEADING_TAGS:
                 blocks.append(f"\n\n## {t}\n")
             else:
                 blocks.append(t)
 
         extracted = "\n".join(blocks).strip()
-        proxy = NormalizedDocument(ref=doc.ref, text=extracted, pages=None)
-
-        chunks = self.text_chunker.chunk(proxy, base_metadata=base_metadata)
+        common = _common_meta(base_metadata, doc, html_extracted=True)
         return [
             Chunk(
                 chunk_id=_chunk_id(doc.ref.checksum, f"h{i}"),
-                doc_id=c.doc_id,
-                text=c.text,
-                metadata=_merge_meta(c.metadata, {"html_extracted": True}),
-                page_number=c.page_number,
-                start_char=c.start_char,
-                end_char=c.end_char,
+                doc_id=doc.ref.doc_id,
+                text=piece,
+                metadata={**common, "chunk_index": i},
             )
-            for i, c in enumerate(chunks)
+            for i, piece in enumerate(self.text_chunker.split(extracted))
         ]
 
 
@@ -195,46 +341,39 @@ class PdfChunker:
     text_chunker: TextChunker
 
     def chunk(
-        self, doc: NormalizedDocument, *, base_metadata: Dict[str, Any]
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
     ) -> List[Chunk]:
+        ck = doc.ref.checksum
+
         if not doc.pages:
             # fallback: big string chunking
-            chunks = self.text_chunker.chunk(doc, base_metadata=base_metadata)
+            common = _common_meta(base_metadata, doc, pdf_page_aware=False)
             return [
                 Chunk(
-                    chunk_id=_chunk_id(doc.ref.checksum, f"p0_{i}"),
-                    doc_id=c.doc_id,
-                    text=c.text,
-                    metadata=_merge_meta(c.metadata, {"pdf_page_aware": False}),
-                    page_number=c.page_number,
-                    start_char=c.start_char,
-                    end_char=c.end_char,
+                    chunk_id=_chunk_id(ck, f"p0_{i}"),
+                    doc_id=doc.ref.doc_id,
+                    text=piece,
+                    metadata={**common, "chunk_index": i},
                 )
-                for i, c in enumerate(chunks)
+                for i, piece in enumerate(self.text_chunker.split(doc.text or ""))
             ]
 
+        # Split each page directly and build every Chunk once with its final
+        # metadata, instead of chunking a proxy doc per page and re-wrapping.
+        common = _common_meta(base_metadata, doc, pdf_page_aware=True)
         out: List[Chunk] = []
         for page_idx, page_text in enumerate(doc.pages, start=1):
             if not (page_text or "").strip():
                 continue
-            proxy = NormalizedDocument(ref=doc.ref, text=page_text, pages=None)
-            page_chunks = self.text_chunker.chunk(
-                proxy,
-                base_metadata=_merge_meta(base_metadata, {"page_number": page_idx}),
-            )
-            for i, c in enumerate(page_chunks):
+            page_common = {**common, "page_number": page_idx}
+            for i, piece in enumerate(self.text_chunker.split(page_text)):
                 out.append(
                     Chunk(
-                        chunk_id=_chunk_id(doc.ref.checksum, f"p{page_idx}_{i}"),
+                        chunk_id=_chunk_id(ck, f"p{page_idx}_{i}"),
                         doc_id=doc.ref.doc_id,
-                        text=c.text,
-                        metadata=_merge_meta(
-                            c.metadata,
-                            {"pdf_page_aware": True, "page_number": page_idx},
-                        ),
+                        text=piece,
+                        metadata={**page_common, "chunk_index": i},
                         page_number=page_idx,
-                        start_char=None,
-                        end_char=None,
                     )
                 )
         return out
@@ -250,7 +389,7 @@ class RouterChunker:
     fallback: Chunker
 
     def chunk(
-        self, doc: NormalizedDocument, *, base_metadata: Dict[str, Any]
+        self, doc: NormalizedDocument, *, base_metadata: Mapping[str, Any]
     ) -> List[Chunk]:
         impl = self.by_doc_type.get(doc.ref.doc_type, self.fallback)
         return impl.chunk(doc, base_metadata=base_metadata)
@@ -261,12 +400,13 @@ def build_default_chunker() -> RouterChunker:
     A sensible default router for your pipeline.
     """
     text = TextChunker(chunk_size=1200, chunk_overlap=150)
+    plain = FastTextChunker(chunk_size=1200, chunk_overlap=150)
     return RouterChunker(
         by_doc_type={
-            "txt": text,
-            "raw": text,
+            "txt": plain,
+            "raw": plain,
             "docx": text,  # later you can make this structure-aware
-            "csv": text,  # later you can make this row-aware
+            "csv": plain,  # later you can make this row-aware
             "json": JsonChunker(text_chunker=text),
             "html": HtmlChunker(text_chunker=text),
             "pdf": PdfChunker(text_chunker=text),
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import List, Protocol, Sequence
+from typing import Protocol, Sequence
+
+import numpy as np
 
 
 class Embedder(Protocol):
     """
     Embedding backend interface used by the semantic pipelines.
 
-    Implementations must return one vector per input text, in the same order.
+    Implementations must return one vector per input text, in the same order,
+    as a single C-contiguous float32 array of shape (len(texts), dim) so
+    vector stores can consume it without per-float conversion.
+
+    Network-bound backends may also provide an awaitable
+    `embed_texts_async(texts)` with the same contract; async callers use it
+    instead of running `embed_texts` in a worker thread.
     """
 
     @property
@@ -17,7 +25,7 @@ class Embedder(Protocol):
         """
         ...
 
-    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
         """
         Generate embeddings for a batch of input texts.
         """
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from .base import Embedder
+
+
+class EmbeddingCache(Protocol):
+    """
+    Storage policy for cached embedding vectors, keyed by text digest.
+    """
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return the cached vectors for whichever keys are present."""
+        ...
+
+    def set_many(self, entries: Dict[str, Any]) -> None:
+        """Store vectors for the given keys."""
+        ...
+
+
+class LRUEmbeddingCache:
+    """
+    In-process cache evicting the least recently used entry when full.
+
+    Each entry holds one vector, 4 bytes per dimension (about 3 KB at 768
+    dimensions), kept separately by every worker process.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._data.move_to_end(key)
+                    found[key] = self._data[key]
+        return found
+
+    def set_many(self, entries: Dict[str, Any]) -> None:
+        with self._lock:
+            for key, vector in entries.items():
+                self._data[key] = vector
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class FIFOEmbeddingCache(LRUEmbeddingCache):
+    """
+    In-process cache evicting the oldest inserted entry when full.
+    Reads do not refresh an entry's position.
+    """
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        with self._lock:
+            return {key: self._data[key] for key in keys if key in self._data}
+
+
+class DiskEmbeddingCache:
+    """
+    Persistent cache backed by `diskcache`, shared across processes and restarts.
+    """
+
+    def __init__(self, directory: str = ".embed_cache") -> None:
+        import diskcache
+
+        self._cache = diskcache.Cache(directory)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        for key in keys:
+            vector = self._cache.get(key)
+            if vector is not None:
+                found[key] = vector
+        return found
+
+    def set_many(self, entries: Dict[str, Any]) -> None:
+        with self._cache.transact():
+            for key, vector in entries.items():
+                self._cache.set(key, vector)
+
+
+class CachedEmbedder(Embedder):
+    """
+    Embedder wrapper that only sends texts it has not embedded before.
+
+    Texts are keyed by a BLAKE2b digest of the model name and the text, so
+    re-ingested documents and repeated boilerplate skip the backend call.
+    """
+
+    def __init__(
+        self, inner: Embedder, cache: Optional[EmbeddingCache] = None
+    ) -> None:
+        self.inner = inner
+        self.cache = cache if cache is not None else LRUEmbeddingCache()
+        self._namespace = str(getattr(inner, "model_name", type(inner).__name__))
+
+    @property
+    def dim(self) -> int:
+        return self.inner.dim
+
+    def _key(self, text: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self._namespace.encode("utf-8"))
+        h.update(b"\x00")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _lookup(
+        self, texts: Sequence[str]
+    ) -> Tuple[List[str], Dict[str, Any], Dict[str, int]]:
+        keys = [self._key(t) for t in texts]
+        found = self.cache.get_many(keys)
+
+        # First index of each distinct missing text, so boilerplate repeated
+        # within a batch is embedded once.
+        misses: Dict[str, int] = {}
+        for i, k in enumerate(keys):
+            if k not in found and k not in misses:
+                misses[k] = i
+        return keys, found, misses
+
+    def _assemble(
+        self,
+        keys: List[str],
+        found: Dict[str, Any],
+        misses: Dict[str, int],
+        fresh: Optional[np.ndarray],
+    ) -> np.ndarray:
+        if misses:
+            # Copy rows so cached entries don't pin the whole batch array.
+            new_entries = {k: v.copy() for k, v in zip(misses, fresh)}
+            self.cache.set_many(new_entries)
+            found.update(new_entries)
+        return np.stack([found[k] for k in keys])
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Serve cached vectors and embed only the misses, preserving input order.
+        """
+        if not texts:
+            return self.inner.embed_texts([])
+
+        keys, found, misses = self._lookup(texts)
+        fresh = None
+        if misses:
+            fresh = self.inner.embed_texts([texts[i] for i in misses.values()])
+        return self._assemble(keys, found, misses, fresh)
+
+    async def embed_texts_async(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Async variant of `embed_texts`; misses go to the inner embedder's
+        `embed_texts_async` when it has one, else to a worker thread.
+        """
+        inner_async = getattr(self.inner, "embed_texts_async", None)
+        if not texts:
+            return await asyncio.to_thread(self.inner.embed_texts, [])
+
+        keys, found, misses = self._lookup(texts)
+        fresh = None
+        if misses:
+            missing = [texts[i] for i in misses.values()]
+            if inner_async is not None:
+                fresh = await inner_async(missing)
+            else:
+                fresh = await asyncio.to_thread(self.inner.embed_texts, missing)
+        return self._assemble(keys, found, misses, fresh)
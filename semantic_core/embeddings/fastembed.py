@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .base import Embedder
+
+
+class FastEmbedEmbeddings(Embedder):
+    """
+    In-process ONNX Runtime embeddings via FastEmbed.
+
+    Runs quantized models on CPU without PyTorch or network calls, which
+    suits latency-sensitive search and offline deployments.
+    Requires the `fastembed` extra.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-small-en-v1.5",
+        *,
+        cache_dir: Optional[str] = None,
+        threads: Optional[int] = None,
+        batch_size: int = 256,
+    ) -> None:
+        from fastembed import TextEmbedding
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = TextEmbedding(
+            model_name=model_name, cache_dir=cache_dir, threads=threads
+        )
+        self._dim = next(
+            (
+                m["dim"]
+                for m in TextEmbedding.list_supported_models()
+                if m["model"] == model_name
+            ),
+            0,
+        )
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed a batch of texts locally, one vector per input in order.
+        """
+        if not texts:
+            return np.empty((0, self._dim), dtype=np.float32)
+        vectors = list(self._model.embed(list(texts), batch_size=self.batch_size))
+        return np.ascontiguousarray(np.stack(vectors), dtype=np.float32)
@@ -1,52 +1,129 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Sequence
+import threading
+from typing import Optional, Sequence
 
+import httpx
+import numpy as np
 from google.genai import types
-import pandas as pd
-from sklearn.metrics.pairwise import cosine_similarity
-
 
 from .base import Embedder
 
 
 class GeminiEmbeddings(Embedder):
     """
-    Placeholder Gemini embeddings backend.
+    Gemini embeddings backend.
+
+    Keeps one `genai.Client` for its lifetime so every request reuses the
+    pooled connections of the given (or SDK-default) httpx client instead
+    of opening a new TLS session per call.
     """
 
-    def __init__(self, model_name: str = "gemini-embedding-001") -> None:
+    # Maximum number of texts per embed_content request.
+    max_batch_size = 100
+
+    def __init__(
+        self,
+        model_name: str = "gemini-embedding-001",
+        *,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.model_name = model_name
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+        self._client = None
+        self._client_lock = threading.Lock()
 
     @property
     def dim(self) -> int:
         # TODO: Implement actual dimension detection logic based on the model
         return 0
 
-    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+    def _get_client(self):
         """
-        Synchronous wrapper around the Gemini embeddings API.
+        Build the Gemini client on first use so construction never needs
+        the API key.
         """
-        from google import genai
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from google import genai
+
+                    API_KEY = os.getenv("GEMINI_API_KEY")
+                    if not API_KEY:
+                        raise ValueError(
+                            "GEMINI_API_KEY environment variable is not set"
+                        )
 
-        API_KEY = os.getenv("GEMINI_API_KEY")
-        if not API_KEY:
-            raise ValueError("GEMINI_API_KEY environment variable is not set")
+                    self._client = genai.Client(
+                        api_key=API_KEY,
+                        http_options=types.HttpOptions(
+                            httpx_client=self.http_client,
+                            httpx_async_client=self.async_http_client,
+                        ),
+                    )
+        return self._client
 
-        client = genai.Client(api_key=API_KEY)
+    def close(self) -> None:
+        """
+        Release the Gemini client. Injected httpx clients are left open for
+        their owner to close.
+        """
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _config(self, dim: int) -> types.EmbedContentConfig:
+        return types.EmbedContentConfig(
+            output_dimensionality=dim,
+            task_type="SEMANTIC_SIMILARITY",
+        )
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Synchronous wrapper around the Gemini embeddings API.
+        """
+        dim = self.dim if self.dim > 0 else 768
         contents = list(texts)
         if not contents:
-            contents = ["placeholder text for empty batch"]
+            return np.empty((0, dim), dtype=np.float32)
 
-        result = client.models.embed_content(
+        result = self._get_client().models.embed_content(
             model=self.model_name,
             contents=contents,
-            config=types.EmbedContentConfig(
-                output_dimensionality=self.dim if self.dim > 0 else 768,
-                task_type="SEMANTIC_SIMILARITY",
-            ),
+            config=self._config(dim),
         )
 
-        embeddings = result.embeddings
-        return embeddings
+        return np.asarray([e.values for e in result.embeddings], dtype=np.float32)
+
+    async def embed_texts_async(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts with concurrent requests of up to `max_batch_size`
+        texts each, on the SDK's async client.
+        """
+        dim = self.dim if self.dim > 0 else 768
+        contents = list(texts)
+        if not contents:
+            return np.empty((0, dim), dtype=np.float32)
+
+        client = self._get_client()
+        step = self.max_batch_size
+        results = await asyncio.gather(
+            *(
+                client.aio.models.embed_content(
+                    model=self.model_name,
+                    contents=contents[i : i + step],
+                    config=self._config(dim),
+                )
+                for i in range(0, len(contents), step)
+            )
+        )
+
+        return np.asarray(
+            [e.values for result in results for e in result.embeddings],
+            dtype=np.float32,
+        )
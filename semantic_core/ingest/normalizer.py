@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 import uuid
 
 from fastapi import HTTPException, UploadFile
@@ -13,43 +24,146 @@ from semantic_core.models import DocumentRef, NormalizedDocument
 from semantic_core.ingest import readers
 
 
-def normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+_WS = re.compile(r"[ \t]+")
+_NL = re.compile(r"\n{3,}")
+
+
+def _collapse_whitespace(text: str) -> str:
+    # Substring checks are C-level scans; most text has single spaces, no
+    # tabs and no CRs, so the regex passes are skipped when nothing matches.
+    if "\r" in text:
+        # Two C-level replaces beat one r"\r\n?" regex pass (~30% faster
+        # on CRLF text); the second returns its input uncopied when no
+        # lone \r remains.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "  " in text or "\t" in text:
+        text = _WS.sub(" ", text)
+    if "\n\n\n" in text:
+        text = _NL.sub("\n\n", text)
     return text
 
 
+# Texts shorter than this are memoized (boilerplate and templated payloads
+# recur across ingests); each cache then holds at most ~32 MiB of ASCII.
+_CACHE_MAX_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=512)
+def _normalize_cached(text: str) -> str:
+    return _collapse_whitespace(text).strip()
+
+
+def normalize_text(text: str) -> str:
+    if len(text) < _CACHE_MAX_CHARS:
+        return _normalize_cached(text)
+    return _collapse_whitespace(text).strip()
+
+
+@lru_cache(maxsize=512)
+def _sha256_cached(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def sha256(text: str) -> str:
+    """
+    Hex SHA-256 of the UTF-8 text. hashlib delegates to OpenSSL, which
+    already dispatches to SHA-NI / ARMv8 SHA instructions at runtime.
+    """
+    if len(text) < _CACHE_MAX_CHARS:
+        return _sha256_cached(text)
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
-def _extract_text_from_file(doc_type: str, data: bytes) -> str:
-    match doc_type:
-        case "txt":
-            return readers.read_txt(data)
-        case "json":
-            return readers.read_json(data)
-        case "csv":
-            return readers.read_csv(data)
-        case "docx":
-            return readers.read_docx(data)
-        case "pdf":
-            return readers.read_pdf(data)
-        case "html":
-            return readers.read_txt(data)
-        case _:
-            raise HTTPException(
-                status_code=400, detail=f"Unsupported doc_type: {doc_type}"
-            )
+def normalize_and_hash(pieces: Iterable[str]) -> Tuple[str, str]:
+    """
+    Normalize streamed text pieces and checksum the result in one pass.
+
+    Equivalent to `normalize_text("".join(pieces))` and `sha256()` of that,
+    but each piece is hashed as soon as it is normalized. The trailing
+    whitespace run of each piece is held back and re-normalized with the
+    next one, so runs spanning piece boundaries collapse exactly as they
+    would in the joined text.
+    """
+    h = hashlib.sha256()
+    parts: list[str] = []
+    pending = ""
+    for piece in pieces:
+        buf = pending + piece
+        tail = ""
+        if buf.endswith("\r"):
+            # may be the first half of a \r\n split across pieces
+            buf, tail = buf[:-1], "\r"
+        buf = _collapse_whitespace(buf)
+        if not parts:
+            buf = buf.lstrip()
+        body = buf.rstrip()
+        pending = buf[len(body) :] + tail
+        if body:
+            h.update(body.encode("utf-8"))
+            parts.append(body)
+    return "".join(parts), h.hexdigest()
+
+
+def _joined_pages(pages: Iterable[str], out: list[str]) -> Iterator[str]:
+    """
+    Yield page texts newline-separated, recording each normalized page in
+    `out` for page-aware chunking.
+    """
+    for i, page in enumerate(pages):
+        out.append(normalize_text(page))
+        yield "\n" + page if i else page
+
+
+_READERS: Dict[str, Callable[[Union[bytes, BinaryIO]], Iterable[str]]] = {
+    "txt": readers.iter_txt,
+    "json": lambda data: [readers.read_json(data)],
+    "csv": readers.iter_csv,
+    "docx": readers.iter_docx,
+    "pdf": readers.iter_pdf,
+    "html": readers.iter_txt,
+}
+
+# Readers that yield one piece per page; pages are kept for chunking.
+_PAGED_TYPES = frozenset({"pdf"})
+
+
+def _extract_text_from_file(
+    doc_type: str, data: Union[bytes, BinaryIO], pages: list[str]
+) -> Iterable[str]:
+    """
+    Stream the text of an uploaded file in reader-sized pieces. PDF page
+    texts are also collected into `pages`.
+    """
+    try:
+        reader = _READERS[doc_type]
+    except KeyError:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported doc_type: {doc_type}"
+        ) from None
+    if doc_type in _PAGED_TYPES:
+        return _joined_pages(reader(data), pages)
+    return reader(data)
 
 
 @dataclass(frozen=True)
 class FileInput:
-    """Framework-agnostic file container."""
+    """
+    Framework-agnostic file container.
 
-    data: bytes
+    Holds either the raw bytes or a readable binary stream (e.g. the
+    spooled temp file behind an upload); streams let PDF/DOCX readers
+    parse without loading the whole file into memory.
+    """
+
+    data: Optional[bytes] = None
     filename: Optional[str] = None
+    stream: Optional[BinaryIO] = None
+
+    @property
+    def source(self) -> Union[bytes, BinaryIO]:
+        if self.stream is not None:
+            return self.stream
+        return self.data or b""
 
 
 class DocumentNormalizer:
@@ -68,6 +182,9 @@ class DocumentNormalizer:
         """
         FastAPI-friendly entrypoint. Accepts UploadFile or FileInput.
         Returns NormalizedDocument.
+
+        Text extraction (PDF/DOCX parsing) runs in a worker thread so it
+        never blocks the event loop.
         """
         if upload_file and file_input:
             raise HTTPException(
@@ -75,10 +192,16 @@ class DocumentNormalizer:
             )
 
         if upload_file is not None:
-            data = await upload_file.read()
-            file_input = FileInput(data=data, filename=upload_file.filename)
+            # UploadFile is already spooled to a temp file by Starlette; hand
+            # the handle to the readers instead of reading it into memory.
+            await upload_file.seek(0)
+            file_input = FileInput(
+                stream=upload_file.file, filename=upload_file.filename
+            )
 
-        return self.normalize(payload, file_input=file_input, created_at=created_at)
+        return await asyncio.to_thread(
+            self.normalize, payload, file_input=file_input, created_at=created_at
+        )
 
     def normalize(
         self,
@@ -91,27 +214,31 @@ class DocumentNormalizer:
         Pure function-style normalization (sync) once file bytes are available.
         Returns NormalizedDocument.
         """
-        # 1) choose text source (define a precedence rule)
-        text: Optional[str] = None
-        if payload.raw_text:
-            text = payload.raw_text
-        elif payload.json_text:
-            text = payload.json_text
+        # 1) choose text source (define a precedence rule), then
+        # 2) normalize + checksum: small inline payloads hit the memoized
+        # helpers, files are normalized and hashed as pieces are extracted
+        pages: list[str] = []
+        inline = payload.raw_text or payload.json_text
+        if inline and len(inline) < _CACHE_MAX_CHARS:
+            text = normalize_text(inline)
+            checksum = sha256(text)
+        elif inline:
+            text, checksum = normalize_and_hash([inline])
         elif file_input is not None:
-            text = _extract_text_from_file(payload.doc_type, file_input.data)
+            text, checksum = normalize_and_hash(
+                _extract_text_from_file(payload.doc_type, file_input.source, pages)
+            )
         else:
             raise HTTPException(
                 status_code=422, detail="Provide one of: raw_text, json_text, or file"
             )
 
-        # 2) normalize + validate
-        text = normalize_text(text)
         if not text:
             raise HTTPException(status_code=400, detail="Extracted text is empty")
 
-        # 3) build ids + checksum
-        checksum = sha256(text)
-        doc_id = str(uuid.uuid4())
+        # 3) build ids: derived from the checksum, so re-ingesting the same
+        # content yields the same doc_id (and chunk ids) instead of duplicates
+        doc_id = str(uuid.UUID(hex=checksum[:32]))
 
         # 4) build ref + normalized doc
         doc_ref = DocumentRef(
@@ -126,4 +253,4 @@ class DocumentNormalizer:
             },
         )
 
-        return NormalizedDocument(ref=doc_ref, text=text)
+        return NormalizedDocument(ref=doc_ref, text=text, pages=pages or None)
@@ -1,16 +1,74 @@
 from __future__ import annotations
 
+import codecs
 import json
+import re
 from io import BytesIO
-from typing import Any
+from typing import Any, BinaryIO, Iterator, Tuple, Union
 
+import orjson
 
-def read_txt(data: bytes) -> str:
-    return data.decode("utf-8", errors="ignore")
+# Readers accept raw bytes or a readable binary stream (e.g. an upload's
+# spooled temp file). PDF/DOCX parsers read streams natively.
+FileSource = Union[bytes, BinaryIO]
 
 
-def read_json(data: bytes) -> str:
-    obj: Any = json.loads(data.decode("utf-8", errors="ignore"))
+def _as_bytes(data: FileSource) -> bytes:
+    return data if isinstance(data, (bytes, bytearray)) else data.read()
+
+
+def _as_stream(data: FileSource) -> BinaryIO:
+    return BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+
+
+# Text files are decoded in blocks of this many bytes when streaming.
+_TEXT_BLOCK = 1 << 20
+# CSV rows are short, so smaller blocks keep per-request memory low.
+_CSV_BLOCK = 1 << 16
+
+
+def iter_txt(data: FileSource, block_size: int = _TEXT_BLOCK) -> Iterator[str]:
+    """
+    Decode UTF-8 text in ~1 MiB pieces; multi-byte sequences split across
+    blocks are carried over by the incremental decoder. In-memory bytes
+    are read through a BytesIO view, so they are never decoded whole.
+    """
+    stream = _as_stream(data)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    while block := stream.read(block_size):
+        if text := decoder.decode(block):
+            yield text
+    if tail := decoder.decode(b"", final=True):
+        yield tail
+
+
+def read_txt(data: FileSource) -> str:
+    return "".join(iter_txt(data))
+
+
+# Integer literals this long may not fit in 64 bits, which orjson would
+# parse as a lossy float.
+_WIDE_INT = re.compile(rb"[0-9]{19,}")
+
+
+def _parse_json(raw: bytes) -> Tuple[Any, bool]:
+    """
+    Parse JSON, returning the object and whether orjson parsed it.
+
+    orjson parses the UTF-8 bytes directly, with no intermediate str, but
+    rejects invalid UTF-8 and NaN/Infinity and loses precision on integers
+    wider than 64 bits; such input goes through the stdlib parser instead.
+    """
+    if _WIDE_INT.search(raw) is None:
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8", "ignore")), False
+
+
+def read_json(data: FileSource) -> str:
+    obj, parsed_fast = _parse_json(_as_bytes(data))
     # common shapes: {"text": "..."} or {"data": {"text": "..."}}
     if isinstance(obj, dict):
         if "text" in obj and isinstance(obj["text"], str):
@@ -22,28 +80,67 @@ def read_json(data: bytes) -> str:
         ):
             return obj["data"]["text"]
     # fallback: stringify
+    if parsed_fast:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # nested deeper than orjson serializes
     return json.dumps(obj, ensure_ascii=False)
 
 
-def read_csv(data: bytes) -> str:
-    # lightweight: convert rows to a text block (no pandas needed)
-    text = data.decode("utf-8", errors="ignore")
-    return text
+def iter_csv(data: FileSource) -> Iterator[str]:
+    # lightweight: the CSV text itself, streamed like a txt file
+    return iter_txt(data, block_size=_CSV_BLOCK)
+
+
+def read_csv(data: FileSource) -> str:
+    return "".join(iter_csv(data))
+
 
+def iter_docx(data: FileSource) -> Iterator[str]:
+    """
+    Yield non-empty paragraphs, newline-separated.
 
-def read_docx(data: bytes) -> str:
+    `Paragraph.text` re-walks the paragraph's runs on every access, so it
+    is read once per paragraph.
+    """
     from docx import Document  # python-docx
 
-    doc = Document(BytesIO(data))
-    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+    doc = Document(_as_stream(data))
+    sep = ""
+    for p in doc.paragraphs:
+        text = p.text
+        if text.strip():
+            yield sep + text
+            sep = "\n"
+
+
+def read_docx(data: FileSource) -> str:
+    return "".join(iter_docx(data))
+
+
+def iter_pdf(data: FileSource) -> Iterator[str]:
+    """
+    Yield the extracted text of each page, in order.
+
+    Uses PyMuPDF's C text extractor when installed (`pdf` extra), else pypdf.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        from pypdf import PdfReader
+
+        reader = PdfReader(_as_stream(data))
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
 
+    # MuPDF needs random access to the whole file; documents are not
+    # thread-safe, so pages are extracted sequentially.
+    with pymupdf.open(stream=_as_bytes(data), filetype="pdf") as doc:
+        for page in doc:
+            yield page.get_text("text")
 
-def read_pdf(data: bytes) -> str:
-    # pypdf is a common choice
-    from pypdf import PdfReader
 
-    reader = PdfReader(BytesIO(data))
-    parts: list[str] = []
-    for page in reader.pages:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts)
+def read_pdf(data: FileSource) -> str:
+    return "\n".join(iter_pdf(data))
@@ -25,11 +25,6 @@ class CoopWiseMetadataBuilder(MetadataBuilder):
         return meta
 
 
-from __future__ import annotations
-
-from typing import Any, Dict
-
-
 def normalize_coopwise_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform Coopwise-specific metadata into a normalized schema.
@@ -24,11 +24,6 @@ class Winnov8MetadataBuilder(MetadataBuilder):
         return meta
 
 
-from __future__ import annotations
-
-from typing import Any, Dict
-
-
 def normalize_winnov8_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform Winnov8-specific metadata into a normalized schema.
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, Iterator, List, Optional, Literal, Sequence, Union
+
+import numpy as np
 
 DocType = Literal[
     "policy",
@@ -66,7 +68,38 @@ class EmbeddedChunk:
     """
 
     chunk: Chunk
-    vector: List[float]
+    vector: Union[np.ndarray, List[float]]  # usually a float32 row from the embedder
+
+
+@dataclass(frozen=True)
+class EmbeddedBatch:
+    """
+    Chunks and their embeddings as parallel arrays: `vectors[i]` is the
+    embedding of `chunks[i]`. Stores read the (N, dim) float32 matrix
+    directly instead of collecting per-chunk vectors.
+    """
+
+    chunks: List[Chunk]
+    vectors: np.ndarray  # shape (len(chunks), dim), float32
+
+    def __post_init__(self) -> None:
+        if len(self.chunks) != len(self.vectors):
+            raise ValueError(
+                f"EmbeddedBatch has {len(self.chunks)} chunks but "
+                f"{len(self.vectors)} vectors"
+            )
+
+    @classmethod
+    def from_items(cls, items: Sequence[EmbeddedChunk]) -> "EmbeddedBatch":
+        vectors = np.asarray([item.vector for item in items], dtype=np.float32)
+        return cls(chunks=[item.chunk for item in items], vectors=vectors)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self) -> Iterator[EmbeddedChunk]:
+        for chunk, vector in zip(self.chunks, self.vectors):
+            yield EmbeddedChunk(chunk=chunk, vector=vector)
 
 
 @dataclass(frozen=True)
@@ -79,6 +112,8 @@ class SearchQuery:
     top_k: int = 10
     min_score: Optional[float] = None
     filters: Dict[str, Any] = field(default_factory=dict)
+    # HNSW search-time candidate list size; None uses the backend default
+    ef_search: Optional[int] = None
 
 
 @dataclass(frozen=True)
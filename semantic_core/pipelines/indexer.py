@@ -1,13 +1,41 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import logging
+import uuid
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
-from semantic_core.models import NormalizedDocument, EmbeddedChunk
+import numpy as np
+
+from semantic_core.models import Chunk, NormalizedDocument, EmbeddedBatch
 from semantic_core.chunking.base import Chunker
 from semantic_core.embeddings.base import Embedder
 from semantic_core.vectorstores.base import VectorStore
 from semantic_core.metadata.base import MetadataBuilder
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most `size` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
 
 class IndexPipeline:
     """
@@ -20,36 +48,226 @@ class IndexPipeline:
         chunker: Chunker,
         embedder: Embedder,
         store: VectorStore,
-        metadata: MetadataBuilder,
+        metadata: Union[MetadataBuilder, Mapping[str, Any]],
+        batch_size: int = 100,
+        embed_concurrency: int = 2,
+        skip_duplicates: bool = True,
     ) -> None:
+        """
+        Initialize the indexing pipeline.
+
+        Args:
+            metadata: Product metadata builder, or a static mapping used
+                as-is for every document.
+            batch_size: Maximum number of texts sent per embedding request.
+                Defaults to 100, the Gemini batch embedding limit.
+            embed_concurrency: Embedding requests kept in flight by `aindex`.
+            skip_duplicates: Return early, without chunking or embedding,
+                when the store already holds a document with the same
+                checksum.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if embed_concurrency < 1:
+            raise ValueError("embed_concurrency must be >= 1")
+
         self.chunker = chunker
         self.embedder = embedder
         self.store = store
         self.metadata = metadata
+        self.batch_size = batch_size
+        self.embed_concurrency = embed_concurrency
+        self.skip_duplicates = skip_duplicates
+
+    def _base_metadata(
+        self, doc: NormalizedDocument, ingest_id: str
+    ) -> Mapping[str, Any]:
+        """
+        Document-level metadata, built once per document and handed to the
+        chunker as a read-only view so it cannot be mutated per chunk.
+        Every chunk is tagged with this run's `ingest_id`.
+        """
+        build = getattr(self.metadata, "build_document_metadata", None)
+        meta = build(doc.ref) if build is not None else self.metadata
+        return MappingProxyType({**meta, "ingest_id": ingest_id})
+
+    def _is_stored(self, doc: NormalizedDocument) -> bool:
+        """Whether the store already holds chunks with this content checksum."""
+        has_checksum = getattr(self.store, "has_checksum", None)
+        return has_checksum is not None and has_checksum(doc.ref.checksum)
+
+    def _already_indexed(self, stored: bool, doc: NormalizedDocument) -> bool:
+        """
+        Whether indexing can be skipped because the store already holds this
+        exact content, so chunking, embedding and upserting would only
+        rewrite the same rows.
+        """
+        if not (stored and self.skip_duplicates):
+            return False
+        logger.info("Skipping %s: checksum already indexed", doc.ref.doc_id)
+        return True
+
+    def _discard_partial(
+        self, doc: NormalizedDocument, ingest_id: str, stored: bool
+    ) -> None:
+        """
+        Remove the chunks a failed run stored, so they do not make
+        `_already_indexed` skip every retry.
+
+        Only rows still tagged with this run's `ingest_id` are deleted:
+        doc and chunk ids are derived from the content, so a concurrent
+        ingest of the same content writes the same rows. If the content
+        was already stored before the run, nothing is deleted, since the
+        run only rewrote rows of an index that was already complete.
+        """
+        if stored:
+            return
+        try:
+            self.store.delete_by_ingest(ingest_id)
+        except Exception:
+            logger.exception("Could not clean up partial index of %s", doc.ref.doc_id)
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed all texts in as few requests as `batch_size` allows.
+        """
+        batches = [
+            self.embedder.embed_texts(batch)
+            for batch in _batched(texts, self.batch_size)
+        ]
+        return batches[0] if len(batches) == 1 else np.concatenate(batches)
 
     def index(self, doc: NormalizedDocument) -> int:
         """
         Chunk, embed, and (optionally) upsert a single normalized document.
         """
+        stored = self._is_stored(doc)
+        if self._already_indexed(stored, doc):
+            return 0
 
-        base_meta = self.metadata  # or: self.metadata.build_document_metadata(doc.ref)
+        ingest_id = uuid.uuid4().hex
+        base_meta = self._base_metadata(doc, ingest_id)
 
         # --- Chunk ---
         chunks = self.chunker.chunk(doc, base_metadata=base_meta)
 
-        print("\nChunks:")
-        for i, c in enumerate(chunks):
-            print(f"Chunk {i}: {c.chunk_id}, length={len(c.text)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for c in chunks:
+                logger.debug("chunk %s len=%d", c.chunk_id, len(c.text))
 
-        # --- Embed ---
-        vectors = self.embedder.embed_texts([c.text for c in chunks])
+        if not chunks:
+            return 0
 
-        # --- Pair chunks + vectors ---
-        embedded: List[EmbeddedChunk] = [
-            EmbeddedChunk(chunk=c, vector=v) for c, v in zip(chunks, vectors)
-        ]
+        # --- Embed (one request per batch, not per chunk) ---
+        vectors = self._embed([c.text for c in chunks])
+
+        # --- Pair chunks + vectors (one matrix, no per-chunk wrappers) ---
+        embedded = EmbeddedBatch(chunks=chunks, vectors=vectors)
 
-        # --- Store (disabled for debugging) ---
-        self.store.upsert(embedded)
+        # --- Store (single batched upsert) ---
+        try:
+            self.store.upsert(embedded)
+        except BaseException:
+            # Multi-request upserts (e.g. Qdrant) may have partly succeeded.
+            self._discard_partial(doc, ingest_id, stored)
+            raise
 
         return len(embedded)
+
+    async def aindex(
+        self, doc: NormalizedDocument, *, embed_concurrency: Optional[int] = None
+    ) -> int:
+        """
+        Async variant of `index` that overlaps embedding with storage.
+
+        Chunks are split into `batch_size` micro-batches and fed through
+        bounded queues: up to `embed_concurrency` workers embed batches while
+        a single writer upserts the ones already embedded. Embedders with an
+        `embed_texts_async` method are awaited directly, as are stores with
+        an `async_upsert`; other blocking calls run in worker threads.
+
+        If any stage fails, the chunks this run already stored are deleted
+        (see `_discard_partial`), so a retry indexes the document from
+        scratch instead of being skipped as a duplicate.
+        """
+        stored = await asyncio.to_thread(self._is_stored, doc)
+        if self._already_indexed(stored, doc):
+            return 0
+
+        ingest_id = uuid.uuid4().hex
+        base_meta = self._base_metadata(doc, ingest_id)
+
+        chunks = await asyncio.to_thread(
+            self.chunker.chunk, doc, base_metadata=base_meta
+        )
+        if not chunks:
+            return 0
+
+        n_workers = embed_concurrency or self.embed_concurrency
+        to_embed: asyncio.Queue[Optional[List[Chunk]]] = asyncio.Queue(maxsize=4)
+        to_store: asyncio.Queue[Optional[EmbeddedBatch]] = asyncio.Queue(maxsize=4)
+
+        async def produce() -> None:
+            for batch in _batched(chunks, self.batch_size):
+                await to_embed.put(batch)
+            for _ in range(n_workers):
+                await to_embed.put(None)
+
+        embed_async = getattr(self.embedder, "embed_texts_async", None)
+
+        async def embed_worker() -> None:
+            while (batch := await to_embed.get()) is not None:
+                texts = [c.text for c in batch]
+                if embed_async is not None:
+                    vectors = await embed_async(texts)
+                else:
+                    vectors = await asyncio.to_thread(self.embedder.embed_texts, texts)
+                await to_store.put(EmbeddedBatch(chunks=batch, vectors=vectors))
+
+        async def embed_stage() -> None:
+            stage = [asyncio.ensure_future(produce())]
+            stage += [asyncio.ensure_future(embed_worker()) for _ in range(n_workers)]
+            try:
+                await asyncio.gather(*stage)
+            finally:
+                # gather does not cancel siblings when one task fails; left
+                # alone they would block forever on the full queues.
+                for task in stage:
+                    task.cancel()
+                await asyncio.gather(*stage, return_exceptions=True)
+            await to_store.put(None)
+
+        upsert_async = getattr(self.store, "async_upsert", None)
+        # The upsert in flight, shielded from cancellation so cleanup can
+        # wait for it instead of racing a write that is still running.
+        in_flight: List[asyncio.Future] = []
+
+        async def write_stage() -> int:
+            written = 0
+            while (batch := await to_store.get()) is not None:
+                if upsert_async is not None:
+                    write = asyncio.ensure_future(upsert_async(batch))
+                else:
+                    write = asyncio.ensure_future(
+                        asyncio.to_thread(self.store.upsert, batch)
+                    )
+                in_flight[:] = [write]
+                await asyncio.shield(write)
+                written += len(batch)
+            return written
+
+        tasks = [
+            asyncio.ensure_future(embed_stage()),
+            asyncio.ensure_future(write_stage()),
+        ]
+        try:
+            _, written = await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would otherwise leave the other blocked on a queue.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *in_flight, return_exceptions=True)
+            # Batches upserted before the failure must not count as indexed.
+            await asyncio.to_thread(self._discard_partial, doc, ingest_id, stored)
+            raise
+        return written
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Protocol, List, Optional, Dict, Any
 
-from semantic_core.models import EmbeddedChunk, SearchQuery, SearchResult
+import numpy as np
+
+from semantic_core.models import EmbeddedBatch, SearchQuery, SearchResult
 
 
 class VectorStore(Protocol):
@@ -12,19 +14,33 @@ class VectorStore(Protocol):
     Concrete implementations can wrap FAISS, pgvector, Qdrant, etc.
     """
 
-    def upsert(self, items: List[EmbeddedChunk]) -> None:
+    def upsert(self, items: EmbeddedBatch) -> None:
         """
         Insert or update embedded chunks in the underlying store.
         """
         ...
 
+    def has_checksum(self, checksum: str) -> bool:
+        """
+        Return True if chunks of a document with this content checksum
+        are already stored.
+        """
+        ...
+
     def delete_by_doc(self, doc_id: str) -> None:
         """
         Remove all chunks belonging to the given logical document.
         """
         ...
 
-    def query(self, qvec: List[float], query: SearchQuery) -> List[SearchResult]:
+    def delete_by_ingest(self, ingest_id: str) -> None:
+        """
+        Remove the chunks whose metadata `ingest_id` matches, i.e. those
+        last written by one indexing run.
+        """
+        ...
+
+    def query(self, qvec: np.ndarray, query: SearchQuery) -> List[SearchResult]:
         """
         Run a vector similarity search using the provided query vector and
         additional filtering / ranking parameters.
@@ -1,32 +1,257 @@
 from __future__ import annotations
 
-from typing import List
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Literal, Optional
 
-from semantic_core.models import EmbeddedChunk, SearchQuery, SearchResult
+import numpy as np
+
+from semantic_core.models import Chunk, EmbeddedBatch, SearchQuery, SearchResult
 from semantic_core.vectorstores.base import VectorStore
 
 
+def _as_matrix(vectors: Any) -> np.ndarray:
+    """
+    Coerce one or more vectors into the C-contiguous float32 matrix FAISS
+    requires. Embedder output already has this layout, so no copy is made.
+    """
+    if isinstance(vectors, np.ndarray):
+        matrix = vectors
+    elif isinstance(vectors, (list, tuple)) and vectors and isinstance(
+        vectors[0], np.ndarray
+    ):
+        matrix = np.stack(vectors)
+    else:
+        matrix = np.asarray(getattr(vectors, "values", vectors))
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    return matrix.reshape(1, -1) if matrix.ndim == 1 else matrix
+
+
 class FaissVectorStore(VectorStore):
     """
     In-memory FAISS vector store.
 
+    Vectors are L2-normalized and kept in an exact inner-product index, so
+    scores are cosine similarities like the other backends. Filters are
+    applied to the over-fetched candidates in Python.
+
+    With `quantization="fp16"` or `"int8"` vectors are stored in a scalar
+    quantized index, cutting memory and scan bandwidth by 2x or 4x for a
+    small loss in score precision.
+
     Intended primarily for local development and testing.
+    Requires the `faiss` extra.
     """
 
-    def __init__(self) -> None:
-        # TODO: initialize FAISS index and any auxiliary mappings
+    def __init__(
+        self,
+        vector_size: Optional[int] = None,
+        quantization: Literal["none", "fp16", "int8"] = "none",
+    ) -> None:
+        """
+        Initialize the FAISS store.
+
+        Args:
+            vector_size: Embedding dimensionality; inferred from the first
+                upsert when omitted
+            quantization: Vector storage format: "none" (float32), "fp16",
+                or "int8" (uniform over the [-1, 1] range of unit vectors)
+        """
+        if quantization not in ("none", "fp16", "int8"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
+        import faiss
+
+        self._faiss = faiss
+        self.vector_size = vector_size
+        self.quantization = quantization
         self._index = None
+        self._next_id = 0
+        self._ids: Dict[str, int] = {}
+        self._chunks: Dict[int, Chunk] = {}
+        self._checksums: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def _ensure_index(self, vectors: np.ndarray):
+        if self._index is None:
+            faiss = self._faiss
+            dim = vectors.shape[1]
+            if self.quantization == "none":
+                inner = faiss.IndexFlatIP(dim)
+            else:
+                qtype = (
+                    faiss.ScalarQuantizer.QT_fp16
+                    if self.quantization == "fp16"
+                    else faiss.ScalarQuantizer.QT_8bit
+                )
+                inner = faiss.IndexScalarQuantizer(
+                    dim, qtype, faiss.METRIC_INNER_PRODUCT
+                )
+                # Stored vectors are L2-normalized, so every component lies
+                # in [-1, 1]. Train int8 on that fixed range rather than on
+                # the first upsert, which may be a single vector (zero
+                # range) and would collapse every later vector to one code.
+                inner.sq.rangestat = faiss.ScalarQuantizer.RS_minmax
+                inner.sq.rangestat_arg = 0.0
+            index = faiss.IndexIDMap2(inner)
+            if not index.is_trained:
+                bounds = np.ones((2, dim), dtype=np.float32)
+                bounds[0] = -1.0
+                index.train(bounds)
+            self._index = index
+            self.vector_size = dim
+        return self._index
+
+    def upsert(self, items: EmbeddedBatch) -> None:
+        """
+        Insert or update embedded chunks in the underlying store.
+
+        Args:
+            items: EmbeddedBatch of chunks and their vectors to upsert
+        """
+        if not items:
+            return
+
+        # normalize_L2 works in place; copy so the caller's batch is untouched.
+        vectors = np.array(items.vectors, dtype=np.float32, order="C")
+        self._faiss.normalize_L2(vectors)
+
+        with self._lock:
+            index = self._ensure_index(vectors)
 
-    def upsert(self, items: List[EmbeddedChunk]) -> None:
-        # TODO: add or update vectors in the FAISS index
-        raise NotImplementedError("FaissVectorStore.upsert is not implemented yet")
+            stale = [
+                self._ids[chunk.chunk_id]
+                for chunk in items.chunks
+                if chunk.chunk_id in self._ids
+            ]
+            if stale:
+                index.remove_ids(np.asarray(stale, dtype=np.int64))
 
-    def query(self, qvec: List[float], query: SearchQuery) -> List[SearchResult]:
-        # TODO: run nearest-neighbor search with FAISS and return SearchResult objects
-        raise NotImplementedError("FaissVectorStore.query is not implemented yet")
+            ids = np.arange(self._next_id, self._next_id + len(items), dtype=np.int64)
+            self._next_id += len(items)
+            for internal_id in stale:
+                self._forget(internal_id)
+            for internal_id, chunk in zip(ids.tolist(), items.chunks):
+                self._ids[chunk.chunk_id] = internal_id
+                self._chunks[internal_id] = chunk
+                checksum = (chunk.metadata or {}).get("checksum")
+                if checksum:
+                    self._checksums[checksum] += 1
+
+            index.add_with_ids(vectors, ids)
+
+    def _forget(self, internal_id: int) -> Optional[Chunk]:
+        """Drop bookkeeping for a removed vector; caller holds the lock."""
+        chunk = self._chunks.pop(internal_id, None)
+        if chunk is not None:
+            checksum = (chunk.metadata or {}).get("checksum")
+            if checksum:
+                self._checksums[checksum] -= 1
+                if self._checksums[checksum] <= 0:
+                    del self._checksums[checksum]
+        return chunk
+
+    def has_checksum(self, checksum: str) -> bool:
+        """
+        Return True if chunks of a document with this checksum are stored.
+
+        Args:
+            checksum: Content checksum of the normalized document
+        """
+        with self._lock:
+            return checksum in self._checksums
+
+    def _matches(self, chunk: Chunk, filters: Dict[str, Any]) -> bool:
+        metadata = chunk.metadata or {}
+        for key, value in filters.items():
+            if value is None or value == {}:
+                continue
+            if isinstance(value, (str, int, bool)):
+                if metadata.get(key) != value:
+                    return False
+            elif isinstance(value, (list, tuple, set)):
+                if metadata.get(key) not in value:
+                    return False
+            else:
+                raise ValueError(f"Unsupported filter value for {key}: {value!r}")
+        return True
+
+    def query(self, qvec: np.ndarray, query: SearchQuery) -> List[SearchResult]:
+        """
+        Run an exact cosine similarity search over the in-memory index.
+
+        Args:
+            qvec: Query vector for similarity search
+            query: SearchQuery object with additional parameters
+
+        Returns:
+            List of SearchResult objects
+        """
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return []
+
+            vector = _as_matrix(qvec)
+            self._faiss.normalize_L2(vector)
+
+            # Over-fetch when filtering since filters run after the search.
+            k = query.top_k if not query.filters else self._index.ntotal
+            scores, ids = self._index.search(vector, min(k, self._index.ntotal))
+
+            results: List[SearchResult] = []
+            for score, internal_id in zip(scores[0].tolist(), ids[0].tolist()):
+                if internal_id < 0:
+                    continue
+                if query.min_score is not None and score < query.min_score:
+                    break
+                chunk = self._chunks[internal_id]
+                if query.filters and not self._matches(chunk, query.filters):
+                    continue
+                results.append(
+                    SearchResult(
+                        chunk_id=chunk.chunk_id,
+                        doc_id=chunk.doc_id,
+                        score=score,
+                        text=chunk.text,
+                        metadata=chunk.metadata,
+                        page_number=chunk.page_number,
+                    )
+                )
+                if len(results) >= query.top_k:
+                    break
+            return results
 
     def delete_by_doc(self, doc_id: str) -> None:
-        # TODO: remove all entries belonging to the given document, if supported
-        raise NotImplementedError(
-            "FaissVectorStore.delete_by_doc is not implemented yet"
-        )
+        """
+        Remove all chunks belonging to the given logical document.
+
+        Args:
+            doc_id: Document ID to delete all chunks for
+        """
+        with self._lock:
+            doomed = [i for i, c in self._chunks.items() if c.doc_id == doc_id]
+            self._remove(doomed)
+
+    def delete_by_ingest(self, ingest_id: str) -> None:
+        """
+        Remove the chunks last written by the given indexing run.
+
+        Args:
+            ingest_id: `ingest_id` metadata value of the run
+        """
+        with self._lock:
+            doomed = [
+                i
+                for i, c in self._chunks.items()
+                if (c.metadata or {}).get("ingest_id") == ingest_id
+            ]
+            self._remove(doomed)
+
+    def _remove(self, doomed: List[int]) -> None:
+        """Drop the given internal ids from the index; caller holds the lock."""
+        if not doomed:
+            return
+        self._index.remove_ids(np.asarray(doomed, dtype=np.int64))
+        for internal_id in doomed:
+            chunk = self._forget(internal_id)
+            self._ids.pop(chunk.chunk_id, None)
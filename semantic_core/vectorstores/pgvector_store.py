@@ -1,31 +1,394 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Literal, Optional
 
-from semantic_core.models import Chunk, SearchQuery, SearchResult
+from semantic_core.models import EmbeddedBatch, SearchQuery, SearchResult
 from semantic_core.vectorstores.base import VectorStore
 
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "chunk_id",
+    "doc_id",
+    "text",
+    "metadata",
+    "page_number",
+    "start_char",
+    "end_char",
+    "embedding",
+)
+
+
+def _vector_literal(vector: Any) -> str:
+    """
+    Render a vector in pgvector's text format, e.g. "[0.1,0.2]".
+    Accepts numpy arrays, plain sequences or objects exposing `.values`.
+    """
+    values = getattr(vector, "values", vector)
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    return "[" + ",".join(map(str, values)) + "]"
+
 
 class PgVectorStore(VectorStore):
     """
     PostgreSQL + pgvector based vector store.
 
-    Implement connection management and SQL schema in a later iteration.
+    Upserts stream every row through a single `COPY ... FROM STDIN` into a
+    session-local staging table, then merge it with one
+    `INSERT ... ON CONFLICT`, so ingest cost is a few round trips per batch
+    rather than one per chunk.
+
+    Embeddings are stored as `vector` (float32) or, with
+    `vector_type="halfvec"`, as float16 (pgvector >= 0.7), halving table
+    and HNSW index size.
+
+    Each call borrows its own connection from a `psycopg_pool`
+    ConnectionPool, so a background upsert's open transaction never shares
+    a session with concurrent queries from other threads.
+
+    Requires the `postgres` extra (psycopg 3 with psycopg_pool).
     """
 
-    def __init__(self, dsn: str) -> None:
-        self.dsn = dsn
+    def __init__(
+        self,
+        connection_string: str,
+        table_name: str = "embeddings",
+        embedding_model: Any = None,
+        vector_size: Optional[int] = None,
+        vector_type: Literal["vector", "halfvec"] = "vector",
+        pool_size: int = 10,
+    ) -> None:
+        """
+        Initialize the pgvector store.
+
+        Args:
+            connection_string: libpq connection string / URL
+            table_name: Table holding chunk rows and embeddings
+            embedding_model: Embedding model (used for its `dim`, if known)
+            vector_size: Embedding dimensionality; inferred from the first
+                upsert when omitted
+            vector_type: Column type for new tables, "vector" or "halfvec"
+            pool_size: Maximum pooled connections
+        """
+        if vector_type not in ("vector", "halfvec"):
+            raise ValueError(f"Unsupported vector_type: {vector_type}")
+
+        from psycopg_pool import ConnectionPool
+
+        self._pool_cls = ConnectionPool
+        self.pool_size = pool_size
+        self.connection_string = connection_string
+        self.table_name = table_name
+        self.embedding_model = embedding_model
+        self.vector_type = vector_type
+
+        if vector_size is None and embedding_model is not None:
+            vector_size = getattr(embedding_model, "dim", 0) or None
+        self.vector_size = vector_size
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._table_ready = False
+
+    # ------- connection / schema -------
+
+    def _connection(self):
+        """
+        Borrow a pooled connection for one call (`with self._connection()
+        as conn:`); it is committed, or rolled back on error, and returned
+        to the pool when the block exits.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = self._pool_cls(
+                        self.connection_string,
+                        min_size=1,
+                        max_size=self.pool_size,
+                        open=True,
+                    )
+        return self._pool.connection()
+
+    def close(self) -> None:
+        """Close the connection pool, if one was opened."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _ensure_table(self, conn, dim: int) -> None:
+        if self._table_ready:
+            return
+
+        from psycopg import sql
+
+        table = sql.Identifier(self.table_name)
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            cur.execute(
+                sql.SQL(
+                    """
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        chunk_id TEXT PRIMARY KEY,
+                        doc_id TEXT NOT NULL,
+                        text TEXT NOT NULL,
+                        metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+                        page_number INTEGER,
+                        start_char INTEGER,
+                        end_char INTEGER,
+                        embedding {vtype}({dim}) NOT NULL
+                    )
+                    """
+                ).format(
+                    table=table, vtype=sql.SQL(self.vector_type), dim=sql.Literal(dim)
+                )
+            )
+            cur.execute(
+                sql.SQL("CREATE INDEX IF NOT EXISTS {idx} ON {table} (doc_id)").format(
+                    idx=sql.Identifier(f"{self.table_name}_doc_id_idx"), table=table
+                )
+            )
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX IF NOT EXISTS {idx} ON {table} "
+                    "((metadata ->> 'checksum'))"
+                ).format(
+                    idx=sql.Identifier(f"{self.table_name}_checksum_idx"), table=table
+                )
+            )
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX IF NOT EXISTS {idx} ON {table} "
+                    "USING hnsw (embedding {opclass})"
+                ).format(
+                    idx=sql.Identifier(f"{self.table_name}_embedding_idx"),
+                    table=table,
+                    opclass=sql.SQL(f"{self.vector_type}_cosine_ops"),
+                )
+            )
+
+        self.vector_size = dim
+        self._table_ready = True
+
+    def _table_exists(self, conn) -> bool:
+        if self._table_ready:
+            return True
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regclass(%s) IS NOT NULL", (self.table_name,))
+            row = cur.fetchone()
+        conn.commit()
+        return bool(row and row[0])
+
+    # ------- VectorStore -------
+
+    def upsert(self, items: EmbeddedBatch) -> None:
+        """
+        Insert or update embedded chunks in the underlying store.
+
+        Args:
+            items: EmbeddedBatch of chunks and their vectors to upsert
+        """
+        if not items:
+            logger.warning("No items to upsert")
+            return
+
+        from psycopg import sql
+
+        rows = [
+            (
+                chunk.chunk_id,
+                chunk.doc_id,
+                chunk.text,
+                json.dumps(chunk.metadata or {}, default=str),
+                chunk.page_number,
+                chunk.start_char,
+                chunk.end_char,
+                _vector_literal(vector),
+            )
+            for chunk, vector in zip(items.chunks, items.vectors)
+        ]
+
+        dim = self.vector_size or items.vectors.shape[1]
+        with self._connection() as conn:
+            self._ensure_table(conn, dim)
+
+            table = sql.Identifier(self.table_name)
+            staging = sql.Identifier(f"_{self.table_name}_staging")
+            columns = sql.SQL(", ").join(sql.Identifier(c) for c in _COLUMNS)
+            updates = sql.SQL(", ").join(
+                sql.SQL("{c} = EXCLUDED.{c}").format(c=sql.Identifier(c))
+                for c in _COLUMNS[1:]
+            )
+
+            with conn.transaction(), conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                        "(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+                    ).format(staging=staging, table=table)
+                )
+                with cur.copy(
+                    sql.SQL("COPY {staging} ({columns}) FROM STDIN").format(
+                        staging=staging, columns=columns
+                    )
+                ) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                cur.execute(
+                    sql.SQL(
+                        "INSERT INTO {table} ({columns}) "
+                        "SELECT {columns} FROM {staging} "
+                        "ON CONFLICT (chunk_id) DO UPDATE SET {updates}"
+                    ).format(
+                        table=table, columns=columns, staging=staging, updates=updates
+                    )
+                )
+
+        logger.info("Upserted %d rows into %s", len(rows), self.table_name)
+
+    def has_checksum(self, checksum: str) -> bool:
+        """
+        Return True if chunks of a document with this checksum are stored.
+
+        Args:
+            checksum: Content checksum of the normalized document
+        """
+        from psycopg import sql
+
+        with self._connection() as conn:
+            if not self._table_exists(conn):
+                return False
+
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "SELECT 1 FROM {table} WHERE metadata ->> 'checksum' = %s LIMIT 1"
+                    ).format(table=sql.Identifier(self.table_name)),
+                    (checksum,),
+                )
+                row = cur.fetchone()
+            conn.commit()
+        return row is not None
+
+    def delete_by_doc(self, doc_id: str) -> None:
+        """
+        Remove all chunks belonging to the given logical document.
+
+        Args:
+            doc_id: Document ID to delete all chunks for
+        """
+        from psycopg import sql
+
+        with self._connection() as conn:
+            if not self._table_exists(conn):
+                return
+
+            with conn.transaction(), conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("DELETE FROM {table} WHERE doc_id = %s").format(
+                        table=sql.Identifier(self.table_name)
+                    ),
+                    (doc_id,),
+                )
+
+    def delete_by_ingest(self, ingest_id: str) -> None:
+        """
+        Remove the chunks last written by the given indexing run.
+
+        Args:
+            ingest_id: `ingest_id` metadata value of the run
+        """
+        from psycopg import sql
+
+        with self._connection() as conn:
+            if not self._table_exists(conn):
+                return
+
+            with conn.transaction(), conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "DELETE FROM {table} WHERE metadata ->> 'ingest_id' = %s"
+                    ).format(table=sql.Identifier(self.table_name)),
+                    (ingest_id,),
+                )
+
+    def _build_where(self, filters: Dict[str, Any]) -> tuple[Any, list]:
+        from psycopg import sql
+
+        clauses = []
+        params: list = []
+        for key, value in (filters or {}).items():
+            if value is None or value == {}:
+                continue
+
+            if isinstance(value, (str, int, bool)):
+                clauses.append(sql.SQL("metadata @> %s::jsonb"))
+                params.append(json.dumps({key: value}))
+                continue
+
+            if isinstance(value, (list, tuple, set)) and all(
+                isinstance(v, (str, int, bool)) for v in value
+            ):
+                clauses.append(sql.SQL("metadata -> %s <@ %s::jsonb"))
+                params.extend([key, json.dumps(list(value))])
+                continue
+
+            raise ValueError(f"Unsupported filter value for {key}: {value!r}")
+
+        if not clauses:
+            return sql.SQL(""), params
+        return sql.SQL("WHERE ") + sql.SQL(" AND ").join(clauses), params
+
+    def query(self, qvec: Any, query: SearchQuery) -> List[SearchResult]:
+        """
+        Run a cosine similarity search using pgvector's `<=>` operator.
+
+        Args:
+            qvec: Query vector for similarity search
+            query: SearchQuery object with additional parameters
+
+        Returns:
+            List of SearchResult objects
+        """
+        from psycopg import sql
+
+        with self._connection() as conn:
+            if not self._table_exists(conn):
+                return []
 
-    async def index_chunks(self, chunks: Iterable[Chunk]) -> None:
-        # TODO: implement bulk upsert into pgvector-backed table
-        raise NotImplementedError("PgVectorStore.index_chunks is not implemented yet")
+            where, params = self._build_where(query.filters)
+            vec = _vector_literal(qvec)
+            stmt = sql.SQL(
+                "SELECT chunk_id, doc_id, text, metadata, page_number, "
+                "1 - (embedding <=> %s::{vtype}) AS score "
+                "FROM {table} {where} "
+                "ORDER BY embedding <=> %s::{vtype} LIMIT %s"
+            ).format(
+                table=sql.Identifier(self.table_name),
+                where=where,
+                vtype=sql.SQL(self.vector_type),
+            )
 
-    async def search(self, query: SearchQuery) -> List[SearchResult]:
-        # TODO: implement similarity search using pgvector operators
-        raise NotImplementedError("PgVectorStore.search is not implemented yet")
+            with conn.cursor() as cur:
+                cur.execute(stmt, [vec, *params, vec, query.top_k])
+                rows = cur.fetchall()
+            conn.commit()
 
-    async def delete_by_document_ids(self, document_ids: Sequence[str]) -> None:
-        # TODO: implement deletion of rows belonging to given documents
-        raise NotImplementedError(
-            "PgVectorStore.delete_by_document_ids is not implemented yet"
-        )
+        results = []
+        for chunk_id, doc_id, text, metadata, page_number, score in rows:
+            if query.min_score is not None and score < query.min_score:
+                continue
+            results.append(
+                SearchResult(
+                    chunk_id=chunk_id,
+                    doc_id=doc_id,
+                    score=float(score),
+                    text=text,
+                    metadata=metadata or {},
+                    page_number=page_number,
+                )
+            )
+        return results
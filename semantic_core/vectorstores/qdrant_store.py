@@ -1,26 +1,72 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
 from qdrant_client.models import (
+    Batch,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Datatype,
     Distance,
     VectorParams,
-    PointStruct,
     Filter,
     FieldCondition,
+    HnswConfigDiff,
     MatchValue,
     MatchAny,
+    PayloadSchemaType,
+    QuantizationSearchParams,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
 )
 
-from qdrant_client import QdrantClient
-from semantic_core.models import EmbeddedChunk, SearchQuery, SearchResult
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from semantic_core.models import (
+    EmbeddedBatch,
+    EmbeddedChunk,
+    SearchQuery,
+    SearchResult,
+)
 from semantic_core.vectorstores.base import VectorStore
+from semantic_core.vectorstores.query_cache import LSHQueryCache, query_key
 import uuid
 
+logger = logging.getLogger(__name__)
+
+# Text embedded to discover the vector size when nothing else reveals it
+_PROBE_TEXT = "This is a longer sample text to ensure we get the correct embedding dimensions."
+
+
+@lru_cache(maxsize=65536)
+def _point_id(chunk_id: str) -> str:
+    """Deterministic Qdrant point id for a chunk id, memoized for re-ingests."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk_id))
+
 
 class QDrantVectorStore(VectorStore):
     """
     Qdrant-backed vector store implementation.
+
+    For remote servers, create the client with gRPC enabled, e.g.
+    `QdrantClient(url=..., prefer_grpc=True, grpc_port=6334)`: vectors are
+    then sent as packed protobuf floats instead of JSON number text, which
+    is several times smaller on the wire and cheaper for the server to
+    parse. A warning is logged when a remote client uses REST.
+
+    Share one client per process rather than building one per request: the
+    gRPC channel and the REST connection pool (size it with
+    `limits=httpx.Limits(...)`) are created once per client and reused, so
+    queries skip TCP/TLS setup.
     """
 
     def __init__(
@@ -29,6 +75,19 @@ class QDrantVectorStore(VectorStore):
         collection_name: str,
         embedding_model: Any,
         vector_size: Optional[int] = None,
+        batch_size: int = 256,
+        vector_datatype: Literal["float32", "float16"] = "float32",
+        bulk_threshold: int = 2048,
+        parallel: int = 1,
+        async_client: Optional[AsyncQdrantClient] = None,
+        concurrency: int = 4,
+        quantization: Literal["none", "scalar", "binary"] = "none",
+        hnsw_m: int = 16,
+        hnsw_ef_construct: int = 100,
+        query_cache_size: int = 0,
+        query_cache_threshold: float = 0.97,
+        query_cache_ttl: Optional[float] = 60.0,
+        payload_index_fields: Optional[Dict[str, str]] = None,
     ) -> None:
         """
         Initialize the Qdrant vector store.
@@ -38,21 +97,72 @@ class QDrantVectorStore(VectorStore):
             collection_name: Name of the collection to use
             embedding_model: Embedding model for generating vectors
             vector_size: Size of the embedding vectors (auto-detected if None)
+            batch_size: Maximum number of points sent per upsert request
+            vector_datatype: Storage precision for new collections; float16
+                halves vector memory and disk (Qdrant >= 1.9)
+            bulk_threshold: Upserts larger than this go through
+                `upload_collection`, which pipelines `batch_size` requests
+            parallel: Worker processes used by `upload_collection`; values
+                above 1 need a remote (not in-memory) client
+            async_client: Optional AsyncQdrantClient for the same server;
+                used by the `async_*` methods, which otherwise fall back to
+                the sync client in a worker thread
+            concurrency: Maximum upsert requests in flight in `async_upsert`
+            quantization: Quantized copy of the vectors kept in RAM for new
+                collections: "none", "scalar" (int8, 4x smaller) or
+                "binary" (1 bit per dimension, 32x smaller); originals stay
+                on disk for rescoring
+            hnsw_m: HNSW graph degree for new collections
+            hnsw_ef_construct: HNSW build-time candidate list size for new
+                collections
+            query_cache_size: LSH buckets of recent query results kept in
+                process (0 disables); cleared on every write
+            query_cache_threshold: Minimum cosine similarity for a new query
+                vector to reuse cached results
+            query_cache_ttl: Seconds a cached result stays valid, bounding
+                staleness from writes by other processes (None never expires)
+            payload_index_fields: Metadata filter keys to index, mapped to
+                their schema ("keyword", "integer", "float", "bool", ...).
+                `doc_id` and `metadata.checksum` are always indexed.
         """
+        if quantization not in ("none", "scalar", "binary"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
         self.client = client
+        if self._uses_rest(client):
+            logger.warning(
+                "Qdrant client is using REST; pass prefer_grpc=True "
+                "for binary vector transport"
+            )
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        # (type, converter) for the vector type seen last, see _extract_vector;
+        # one attribute so readers never pair a type with another's converter
+        self._fast: Optional[Tuple[type, Callable[[Any], List[float]]]] = None
+        self.batch_size = batch_size
+        self.bulk_threshold = bulk_threshold
+        self.parallel = parallel
+        self.async_client = async_client
+        self.concurrency = concurrency
+        self.quantization = quantization
+        self._filter_cache: OrderedDict[str, Optional[Filter]] = OrderedDict()
+        self._filter_cache_lock = threading.Lock()
+        self._query_cache = (
+            LSHQueryCache(
+                maxsize=query_cache_size,
+                threshold=query_cache_threshold,
+                ttl=query_cache_ttl,
+            )
+            if query_cache_size > 0
+            else None
+        )
 
         # Auto-detect vector size if not provided
         if vector_size is None:
-            print("Auto-detecting vector size...")
-            # Use a longer sample text to get actual embedding size
-            sample_vector = embedding_model.embed_texts(
-                "This is a longer sample text to ensure we get the correct embedding dimensions."
-            )
-            vector_size = len(self._extract_vector(sample_vector))
-            print(f"Detected vector size: {vector_size}")
+            vector_size = self._detect_vector_size()
 
+        if vector_size < 1:
+            raise ValueError(f"Invalid vector size: {vector_size}")
         self.vector_size = vector_size
 
         # Create collection if it doesn't exist
@@ -60,19 +170,129 @@ class QDrantVectorStore(VectorStore):
             client.create_collection(
                 collection_name=collection_name,
                 vectors_config=VectorParams(
-                    size=vector_size if vector_size < 128 else 768,
+                    size=vector_size,
+                    # Qdrant normalizes COSINE vectors once on insert and
+                    # scores them by dot product, so search already does no
+                    # per-comparison sqrt/divide; DOT plus client-side
+                    # normalization would only move that work here.
                     distance=Distance.COSINE,
+                    datatype=Datatype(vector_datatype),
                 ),
+                hnsw_config=HnswConfigDiff(m=hnsw_m, ef_construct=hnsw_ef_construct),
+                quantization_config=self._quantization_config(quantization),
+            )
+
+        self._ensure_payload_indexes(payload_index_fields)
+
+    def _ensure_payload_indexes(self, fields: Optional[Dict[str, str]]) -> None:
+        """
+        Create payload indexes for the fields deletes and filters match on,
+        so those lookups don't scan every payload. Indexing is a deliberate
+        build-time choice: each index costs memory and slows writes a little,
+        so only keys actually used in filters should be listed. Creating an
+        existing index is a no-op; the local (in-memory) client has no
+        payload indexes and is skipped.
+        """
+        if self._is_local(self.client):
+            return
+
+        schemas = {
+            "doc_id": PayloadSchemaType.KEYWORD,
+            "metadata.checksum": PayloadSchemaType.KEYWORD,
+        }
+        for key, schema in (fields or {}).items():
+            schemas[f"metadata.{key}"] = PayloadSchemaType(schema.lower())
+
+        for field_name, schema in schemas.items():
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=schema,
             )
 
+    @staticmethod
+    def _is_local(client: Any) -> bool:
+        """True for the embedded (in-memory or on-disk) local client."""
+        return type(getattr(client, "_client", None)).__name__ == "QdrantLocal"
+
+    @staticmethod
+    def _quantization_config(quantization: str):
+        """Collection quantization settings for the given mode, or None."""
+        if quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+        if quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def _detect_vector_size(self) -> int:
+        """
+        Find the embedding size without an embedding call where possible:
+        from the existing collection, then the embedder's `dim`, and only
+        then by embedding a probe text.
+        """
+        try:
+            if self.client.collection_exists(self.collection_name):
+                info = self.client.get_collection(self.collection_name)
+                size = getattr(info.config.params.vectors, "size", None)
+                if size:
+                    logger.debug("Vector size %d from existing collection", size)
+                    return size
+        except Exception as e:
+            logger.debug("Could not read collection vector size: %s", e)
+
+        size = getattr(self.embedding_model, "dim", 0)
+        if size:
+            logger.debug("Vector size %d from embedder", size)
+            return size
+
+        logger.debug("Probing embedder for vector size")
+        sample_vector = self.embedding_model.embed_texts([_PROBE_TEXT])[0]
+        size = len(self._extract_vector(sample_vector))
+        logger.debug("Detected vector size: %d", size)
+        return size
+
+    @staticmethod
+    def _uses_rest(client: Any) -> bool:
+        """True for a remote client that sends requests over REST/JSON."""
+        inner = getattr(client, "_client", None)
+        return getattr(inner, "_prefer_grpc", None) is False
+
     def _extract_vector(self, vector) -> List[float]:
+        """
+        Extract vector values, specialized on the input type.
+
+        A deployment's embedder always returns the same vector type, so the
+        first call picks a direct converter for that type and later calls
+        of the same type skip the format checks in
+        `_extract_vector_dispatch`, which still handles anything else.
+        """
+        fast = self._fast
+        if fast is not None and type(vector) is fast[0]:
+            return fast[1](vector)
+
+        values = self._extract_vector_dispatch(vector)
+
+        if isinstance(vector, np.ndarray):
+            self._fast = (type(vector), np.ndarray.tolist)
+        elif hasattr(vector, "values") and not isinstance(vector, (list, tuple)):
+            self._fast = (
+                type(vector),
+                lambda v: np.asarray(v.values, dtype=np.float64).tolist(),
+            )
+        return values
+
+    def _extract_vector_dispatch(self, vector) -> List[float]:
         """
         Extract vector values from various formats.
 
         Handles:
         - ContentEmbedding objects (Vertex AI)
         - Plain lists
-        - Numpy arrays
+        - Numpy arrays (the Embedder protocol's native output)
         - Other embedding objects with .values attribute
 
         Args:
@@ -100,14 +320,14 @@ class QDrantVectorStore(VectorStore):
         elif isinstance(vector, list):
             # Handle list of ContentEmbedding objects or similar with .values
             if vector and hasattr(vector[0], "values"):
-                return self._extract_vector(vector[0].values)
+                return self._extract_vector_dispatch(vector[0].values)
             # Handle list of floats/numbers
             else:
                 return [float(v) for v in vector]
 
-        # Case 3: Numpy array
+        # Case 3: Numpy array (tolist already yields Python floats)
         elif hasattr(vector, "tolist"):
-            return [float(v) for v in vector.tolist()]
+            return vector.tolist()
 
         # Case 4: Tuple (convert to list)
         elif isinstance(vector, tuple):
@@ -121,6 +341,68 @@ class QDrantVectorStore(VectorStore):
                 f"Got: {vector}"
             )
 
+    def _extract_vectors_batch(self, vectors) -> np.ndarray:
+        """
+        Convert a whole batch of vectors into one (N, D) float32 matrix.
+
+        Handles:
+        - Numpy matrices (the Embedder protocol's native output), no copy
+        - Lists of numpy arrays or of plain float lists
+        - Lists of ContentEmbedding-like objects with .values
+
+        Args:
+            vectors: Batch of vectors in any supported format
+
+        Returns:
+            C-contiguous float32 array of shape (N, D)
+        """
+        if isinstance(vectors, np.ndarray):
+            matrix = vectors
+        elif len(vectors) and hasattr(vectors[0], "values"):
+            matrix = np.asarray([v.values for v in vectors], dtype=np.float32)
+        elif len(vectors) and isinstance(vectors[0], np.ndarray):
+            matrix = np.stack(vectors)
+        else:
+            matrix = np.asarray(vectors, dtype=np.float32)
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        return matrix.reshape(1, -1) if matrix.ndim == 1 else matrix
+
+    def _search_params(self, query: SearchQuery) -> Optional[SearchParams]:
+        """
+        Per-query HNSW and quantization knobs: `ef_search` trades recall for
+        latency, and quantized collections rescore an oversampled candidate
+        set against the original vectors. None when the defaults apply.
+        """
+        hnsw_ef = getattr(query, "ef_search", None)
+        quantization = None
+        if self.quantization != "none":
+            quantization = QuantizationSearchParams(rescore=True, oversampling=2.0)
+        if hnsw_ef is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=hnsw_ef, quantization=quantization)
+
+    def _query_filter(self, filters: Optional[dict]) -> Filter | None:
+        """
+        Return the Qdrant Filter for these filters, reusing the instance
+        built for an identical filter dict earlier (LRU of 256). Filters are
+        never mutated after construction, so sharing them is safe.
+        """
+        if not filters:
+            return None
+
+        key = repr(sorted(filters.items()))
+        with self._filter_cache_lock:
+            if key in self._filter_cache:
+                self._filter_cache.move_to_end(key)
+                return self._filter_cache[key]
+
+        built = self._build_qdrant_filter(filters)
+        with self._filter_cache_lock:
+            self._filter_cache[key] = built
+            if len(self._filter_cache) > 256:
+                self._filter_cache.popitem(last=False)
+        return built
+
     def _build_qdrant_filter(self, filters: dict) -> Filter | None:
         if not filters:
             return None
@@ -179,63 +461,204 @@ class QDrantVectorStore(VectorStore):
 
         return Filter(must=conditions) if conditions else None
 
-    def upsert(self, items: List[EmbeddedChunk]) -> None:
+    def _prepare_points(
+        self, items: EmbeddedBatch
+    ) -> Tuple[List[str], np.ndarray, List[dict]]:
+        """
+        Build the id, vector and payload columns for a batch of chunks.
+
+        Returns:
+            Tuple of (point ids, (N, D) float32 vectors, payloads)
+        """
+        # Convert the whole batch in one C-level pass instead of per vector
+        matrix = self._extract_vectors_batch(items.vectors)
+
+        # Parallel id/payload columns, sent as Batch objects so each request
+        # is validated once rather than once per PointStruct
+        ids = []
+        payloads = []
+        for chunk in items.chunks:
+            # Generate a deterministic UUID from the chunk_id (BLAKE2b hex digest)
+            chunk_id = chunk.chunk_id
+            if chunk_id:
+                point_id = _point_id(chunk_id)
+            else:
+                point_id = str(uuid.uuid4())
+
+            # Create payload with metadata
+            # Chunk is a dataclass with every field declared, so plain
+            # attribute access is enough
+            ids.append(point_id)
+            payloads.append(
+                {
+                    "doc_id": chunk.doc_id,
+                    "chunk_id": point_id,
+                    "text": chunk.text,
+                    "metadata": chunk.metadata or {},
+                    "page_number": chunk.page_number,
+                    "start_char": chunk.start_char,
+                    "end_char": chunk.end_char,
+                }
+            )
+
+        return ids, matrix, payloads
+
+    def _batches(
+        self, ids: List[str], matrix: np.ndarray, payloads: List[dict]
+    ) -> List[Batch]:
+        """Split prepared columns into `batch_size` Batch requests."""
+        vectors = matrix.tolist()
+        return [
+            Batch(
+                ids=ids[start : start + self.batch_size],
+                vectors=vectors[start : start + self.batch_size],
+                payloads=payloads[start : start + self.batch_size],
+            )
+            for start in range(0, len(ids), self.batch_size)
+        ]
+
+    def upsert(self, items: EmbeddedBatch) -> None:
         """
         Insert or update embedded chunks in the underlying store.
 
         Args:
-            items: List of EmbeddedChunk objects to upsert
+            items: EmbeddedBatch of chunks and their vectors to upsert
         """
         if not items:
-            print.warning("No items to upsert")
+            logger.warning("No items to upsert")
             return
 
-        print(
-            f"Upserting {len(items)} items to Qdrant collection '{self.collection_name}'"
+        logger.debug(
+            "Upserting %d items to Qdrant collection '%s'",
+            len(items),
+            self.collection_name,
         )
 
-        points = []
-        for item in items:
-            # Get the chunk_id (SHA256 hash string)
-            chunk_id = getattr(item, "chunk_id", None) or getattr(
-                item.chunk, "chunk_id", None
+        ids, matrix, payloads = self._prepare_points(items)
+
+        try:
+            if len(ids) > self.bulk_threshold:
+                # Large loads: let the client batch, retry and (optionally)
+                # fan out across processes. The matrix is passed as is to
+                # skip an intermediate conversion on our side, but the
+                # client still turns each batch slice into Python float
+                # lists (`.tolist()`) in this process before handing it to
+                # the `parallel` workers.
+                self.client.upload_collection(
+                    collection_name=self.collection_name,
+                    vectors=matrix,
+                    payload=payloads,
+                    ids=ids,
+                    batch_size=self.batch_size,
+                    parallel=self.parallel,
+                    wait=True,
+                )
+                logger.debug(
+                    "Uploaded %d points to collection '%s'",
+                    len(ids),
+                    self.collection_name,
+                )
+                return
+
+            # Upsert points in bounded multi-point requests
+            for batch in self._batches(ids, matrix, payloads):
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=batch,
+                )
+            logger.debug(
+                "Upserted %d points to collection '%s'", len(ids), self.collection_name
             )
+        except Exception as e:
+            logger.error("Error upserting to Qdrant: %s", e)
+            raise
+        finally:
+            self._invalidate_query_cache()
 
-            # Generate a deterministic UUID from the chunk_id
-            if chunk_id:
-                point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk_id))
-            else:
-                point_id = str(uuid.uuid4())
+    def upsert_stream(self, items: Iterable[EmbeddedChunk]) -> Iterator[int]:
+        """
+        Upsert embedded chunks from any iterable, holding at most
+        `batch_size` points in memory at a time.
 
-            # Extract the actual vector values
-            # Handle different vector formats (ContentEmbedding, list, numpy array, etc.)
-            vector = self._extract_vector(item.vector)
+        This is a generator: nothing is sent until it is iterated, e.g.
+        `for done in store.upsert_stream(items): ...`.
 
-            # Create payload with metadata
-            payload = {
-                "doc_id": item.chunk.doc_id,
-                "chunk_id": point_id,
-                "text": item.chunk.text,
-                "metadata": getattr(item.chunk, "metadata", {}),
-                "page_number": getattr(item.chunk, "page_number", None),
-                "start_char": getattr(item.chunk, "start_char", None),
-                "end_char": getattr(item.chunk, "end_char", None),
-            }
+        Args:
+            items: Iterable of EmbeddedChunk objects
+
+        Yields:
+            Running total of points upserted after each request
+        """
+        it = iter(items)
+        done = 0
+        try:
+            while batch := list(islice(it, self.batch_size)):
+                ids, matrix, payloads = self._prepare_points(
+                    EmbeddedBatch.from_items(batch)
+                )
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=Batch(ids=ids, vectors=matrix.tolist(), payloads=payloads),
+                )
+                done += len(ids)
+                yield done
+        finally:
+            if done:
+                self._invalidate_query_cache()
+
+    async def async_upsert(self, items: EmbeddedBatch) -> None:
+        """
+        Async variant of `upsert`. With an `async_client`, the batch
+        requests are sent concurrently (at most `concurrency` in flight);
+        otherwise `upsert` runs in a worker thread.
+
+        Args:
+            items: EmbeddedBatch of chunks and their vectors to upsert
+        """
+        if self.async_client is None:
+            await asyncio.to_thread(self.upsert, items)
+            return
+        if not items:
+            return
 
-            # Create point with vector and payload
-            point = PointStruct(id=point_id, vector=vector, payload=payload)
+        ids, matrix, payloads = self._prepare_points(items)
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-            points.append(point)
+        async def send(batch: Batch) -> None:
+            async with semaphore:
+                await self.async_client.upsert(
+                    collection_name=self.collection_name,
+                    points=batch,
+                )
 
         try:
-            # Upsert points to collection
-            self.client.upsert(collection_name=self.collection_name, points=points)
-            print(
-                f"Successfully upserted {len(points)} points to collection '{self.collection_name}'"
+            await asyncio.gather(
+                *(send(batch) for batch in self._batches(ids, matrix, payloads))
             )
-        except Exception as e:
-            print(f"Error upserting to Qdrant: {e}")
-            raise
+        finally:
+            self._invalidate_query_cache()
+
+    def has_checksum(self, checksum: str) -> bool:
+        """
+        Return True if chunks of a document with this checksum are stored.
+
+        Args:
+            checksum: Content checksum of the normalized document
+        """
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=Filter(
+                must=[
+                    FieldCondition(
+                        key="metadata.checksum", match=MatchValue(value=checksum)
+                    )
+                ]
+            ),
+            limit=1,
+            with_payload=False,
+            with_vectors=False,
+        )
+        return bool(points)
 
     def delete_by_doc(self, doc_id: str) -> None:
         """
@@ -251,8 +674,51 @@ class QDrantVectorStore(VectorStore):
                 must=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))]
             ),
         )
+        self._invalidate_query_cache()
+
+    async def async_delete_by_doc(self, doc_id: str) -> None:
+        """
+        Async variant of `delete_by_doc`.
+
+        Args:
+            doc_id: Document ID to delete all chunks for
+        """
+        if self.async_client is None:
+            await asyncio.to_thread(self.delete_by_doc, doc_id)
+            return
+        await self.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=Filter(
+                must=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))]
+            ),
+        )
+        self._invalidate_query_cache()
+
+    def delete_by_ingest(self, ingest_id: str) -> None:
+        """
+        Remove the chunks last written by the given indexing run.
+
+        Args:
+            ingest_id: `ingest_id` metadata value of the run
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=Filter(
+                must=[
+                    FieldCondition(
+                        key="metadata.ingest_id", match=MatchValue(value=ingest_id)
+                    )
+                ]
+            ),
+        )
+        self._invalidate_query_cache()
 
-    def query(self, qvec: List[float], query: SearchQuery) -> List[SearchResult]:
+    def _invalidate_query_cache(self) -> None:
+        """Forget cached query results once the collection has changed."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def query(self, qvec: Any, query: SearchQuery) -> List[SearchResult]:
         """
         Run a vector similarity search using the provided query vector and
         additional filtering / ranking parameters.
@@ -264,8 +730,19 @@ class QDrantVectorStore(VectorStore):
         Returns:
             List of SearchResult objects
         """
+        vector = self._extract_vector(qvec)
+
+        # Serve near-identical repeat queries from the in-process cache
+        cache = self._query_cache
+        if cache is not None:
+            cache_key = query_key(query)
+            generation = cache.generation
+            cached = cache.get(vector, cache_key)
+            if cached is not None:
+                return cached
+
         # Build filter if needed
-        query_filter = self._build_qdrant_filter(getattr(query, "filters", None))
+        query_filter = self._query_filter(getattr(query, "filters", None))
 
         # Determine limit
         limit = getattr(query, "top_k", 10)
@@ -273,14 +750,61 @@ class QDrantVectorStore(VectorStore):
         # Perform search
         search_results = self.client.query_points(
             collection_name=self.collection_name,
-            query=qvec.values,
+            query=vector,
             query_filter=query_filter,
             limit=limit,
+            search_params=self._search_params(query),
+            with_payload=True,
+            with_vectors=False,
         )
 
-        # Convert to SearchResult objects
+        results = self._to_results(search_results.points)
+        if cache is not None:
+            cache.put(vector, cache_key, results, generation=generation)
+        return results
+
+    async def async_query(self, qvec: Any, query: SearchQuery) -> List[SearchResult]:
+        """
+        Async variant of `query`, sent through `async_client` when set.
+
+        Args:
+            qvec: Query vector for similarity search
+            query: SearchQuery object with additional parameters
+
+        Returns:
+            List of SearchResult objects
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.query, qvec, query)
+
+        vector = self._extract_vector(qvec)
+        cache = self._query_cache
+        if cache is not None:
+            cache_key = query_key(query)
+            generation = cache.generation
+            cached = cache.get(vector, cache_key)
+            if cached is not None:
+                return cached
+
+        search_results = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=vector,
+            query_filter=self._query_filter(getattr(query, "filters", None)),
+            limit=getattr(query, "top_k", 10),
+            search_params=self._search_params(query),
+            with_payload=True,
+            with_vectors=False,
+        )
+        results = self._to_results(search_results.points)
+        if cache is not None:
+            cache.put(vector, cache_key, results, generation=generation)
+        return results
+
+    def _to_results(self, points) -> List[SearchResult]:
+        """Convert scored Qdrant points to SearchResult objects."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         results = []
-        for hit in search_results.points:
+        for hit in points:
             result = SearchResult(
                 doc_id=hit.payload.get("doc_id"),
                 chunk_id=hit.payload.get("chunk_id"),
@@ -289,7 +813,13 @@ class QDrantVectorStore(VectorStore):
                 metadata=hit.payload.get("metadata", {}),
                 vector=hit.vector if hasattr(hit, "vector") else None,
             )
-            print(f"\nSearch hit: chunk_id={result.chunk_id}, text={result.text[:50]}..., \nscore={result.score}\n")
+            if debug:
+                logger.debug(
+                    "Search hit: chunk_id=%s score=%s text=%.50s",
+                    result.chunk_id,
+                    result.score,
+                    result.text,
+                )
             results.append(result)
 
         return results
@@ -299,6 +829,7 @@ class QDrantVectorStore(VectorStore):
         Delete the entire collection (useful for cleanup).
         """
         self.client.delete_collection(collection_name=self.collection_name)
+        self._invalidate_query_cache()
 
     def get_collection_info(self) -> dict:
         """
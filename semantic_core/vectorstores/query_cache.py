@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from semantic_core.models import SearchQuery, SearchResult
+
+
+def query_key(query: SearchQuery) -> Hashable:
+    """
+    Everything besides the vector that shapes a query's results, so hits
+    are only shared between queries asking for the same thing.
+    """
+    filters = getattr(query, "filters", None) or {}
+    return (
+        getattr(query, "top_k", 10),
+        getattr(query, "min_score", None),
+        getattr(query, "ef_search", None),
+        repr(sorted(filters.items())),
+    )
+
+
+class LSHQueryCache:
+    """
+    In-process cache of search results for near-identical query vectors.
+
+    Vectors are bucketed by a random-hyperplane LSH signature (one bit per
+    hyperplane, at most 63); within a bucket, a cached entry is reused when its cosine
+    similarity to the new query is at least `threshold`. Buckets are
+    evicted least recently used, and entries older than `ttl` seconds are
+    ignored. Callers must `clear()` on every write; writes made by other
+    processes are only seen once `ttl` expires.
+
+    A query racing a write should read `generation` before searching and
+    pass it to `put`, which drops the results if a `clear()` happened in
+    between.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        threshold: float = 0.97,
+        bits: int = 16,
+        per_bucket: int = 4,
+        seed: int = 0,
+        ttl: Optional[float] = 60.0,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.bits = bits
+        self.per_bucket = per_bucket
+        self._rng = np.random.default_rng(seed)
+        self._projections: Optional[np.ndarray] = None
+        self._weights = np.left_shift(1, np.arange(bits, dtype=np.int64))
+        self._buckets: OrderedDict[
+            Tuple[int, Hashable],
+            List[Tuple[np.ndarray, List[SearchResult], float]],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of `clear()` calls so far."""
+        return self._generation
+
+    def _unit(self, vector: Any) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(v))
+        return v / norm if norm else v
+
+    def _signature(self, unit: np.ndarray) -> int:
+        if self._projections is None or self._projections.shape[0] != unit.shape[0]:
+            self._projections = self._rng.standard_normal(
+                (unit.shape[0], self.bits)
+            ).astype(np.float32)
+        bits = (unit @ self._projections) > 0
+        return int(bits @ self._weights)
+
+    def get(self, vector: Any, key: Hashable) -> Optional[List[SearchResult]]:
+        """Return cached results for a close enough vector, else None."""
+        unit = self._unit(vector)
+        with self._lock:
+            bucket_key = (self._signature(unit), key)
+            bucket = self._buckets.get(bucket_key)
+            if not bucket:
+                return None
+            oldest = time.monotonic() - self.ttl if self.ttl else None
+            for cached, results, stored in bucket:
+                if oldest is not None and stored < oldest:
+                    continue
+                if float(cached @ unit) >= self.threshold:
+                    self._buckets.move_to_end(bucket_key)
+                    return list(results)
+        return None
+
+    def put(
+        self,
+        vector: Any,
+        key: Hashable,
+        results: List[SearchResult],
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Remember the results of a query.
+
+        Args:
+            vector: Query vector the results were searched with
+            key: Result-shaping query parameters, see `query_key`
+            results: Search results to cache
+            generation: `generation` read before the search; the results
+                are dropped if the cache was cleared since
+        """
+        unit = self._unit(vector)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            bucket_key = (self._signature(unit), key)
+            bucket = self._buckets.setdefault(bucket_key, [])
+            bucket.append((unit, list(results), time.monotonic()))
+            del bucket[: -self.per_bucket]
+            self._buckets.move_to_end(bucket_key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result, e.g. after the collection changed."""
+        with self._lock:
+            self._generation += 1
+            self._buckets.clear()
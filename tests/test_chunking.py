@@ -0,0 +1,81 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from semantic_core.chunking.base import FastTextChunker
+from semantic_core.models import DocumentRef, NormalizedDocument
+
+
+def _words(n: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(n):
+        word = "".join(rng.choice("abcdefgh") for _ in range(rng.randint(1, 9)))
+        parts.append(word + rng.choice([" ", " ", " ", ". ", "\n", "\n\n"]))
+    return "".join(parts)
+
+
+def _doc(text: str) -> NormalizedDocument:
+    ref = DocumentRef("d", "s", "txt", datetime(2024, 1, 1), "ck")
+    return NormalizedDocument(ref=ref, text=text)
+
+
+@pytest.mark.parametrize("size,overlap", [(50, 0), (50, 10), (200, 40), (1200, 150)])
+@pytest.mark.parametrize("seed", range(5))
+def test_chunks_fit_overlap_and_cover_text(size, overlap, seed):
+    text = _words(2000, seed)
+    spans = FastTextChunker(chunk_size=size, chunk_overlap=overlap).spans(text)
+
+    assert spans
+    for start, end in spans:
+        assert 0 < end - start <= size
+    for (s1, e1), (s2, e2) in zip(spans, spans[1:]):
+        assert s1 < s2 and e1 < e2
+        assert e1 - s2 <= overlap  # overlap never exceeds chunk_overlap
+        # nothing but whitespace is skipped between chunks
+        assert not text[e1:s2].strip()
+
+    assert not text[: spans[0][0]].strip()
+    assert not text[spans[-1][1] :].strip()
+
+
+def test_consecutive_chunks_share_overlap():
+    text = _words(2000)
+    spans = FastTextChunker(chunk_size=200, chunk_overlap=40).spans(text)
+    assert all(s2 < e1 for (_, e1), (s2, _) in zip(spans, spans[1:]))
+
+
+def test_offsets_slice_back_to_chunk_text():
+    text = _words(1000)
+    chunks = FastTextChunker(chunk_size=120, chunk_overlap=20).chunk(
+        _doc(text), base_metadata={}
+    )
+    assert chunks
+    for i, chunk in enumerate(chunks):
+        assert text[chunk.start_char : chunk.end_char] == chunk.text
+        assert chunk.metadata["chunk_index"] == i
+
+
+def test_input_without_spaces_is_hard_cut():
+    text = "x" * 1000
+    spans = FastTextChunker(chunk_size=100, chunk_overlap=10).spans(text)
+    assert spans[0][0] == 0 and spans[-1][1] == len(text)
+    assert all(e - s == 100 for s, e in spans[:-1])
+    # with no word boundary to snap to, the overlap is exactly chunk_overlap
+    assert all(e1 - s2 == 10 for (_, e1), (s2, _) in zip(spans, spans[1:]))
+
+
+@pytest.mark.parametrize("text", ["", "   \n\n  "])
+def test_empty_input(text):
+    chunker = FastTextChunker(chunk_size=100, chunk_overlap=10)
+    assert chunker.split(text) == []
+    assert chunker.chunk(_doc(text), base_metadata={}) == []
+
+
+def test_text_shorter_than_one_window():
+    text = "  just a short note.\n"
+    chunker = FastTextChunker(chunk_size=100, chunk_overlap=10)
+    assert chunker.split(text) == ["just a short note."]
+    (chunk,) = chunker.chunk(_doc(text), base_metadata={})
+    assert text[chunk.start_char : chunk.end_char] == chunk.text
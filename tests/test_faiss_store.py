@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from semantic_core.models import Chunk, EmbeddedBatch, SearchQuery
+from semantic_core.vectorstores.faiss_store import FaissVectorStore
+
+
+def _batch(start: int, vectors: np.ndarray) -> EmbeddedBatch:
+    chunks = [
+        Chunk(chunk_id=f"c{start + i}", doc_id="d", text=f"t{start + i}", metadata={})
+        for i in range(len(vectors))
+    ]
+    return EmbeddedBatch(chunks=chunks, vectors=vectors)
+
+
+@pytest.mark.parametrize("quantization", ["none", "fp16", "int8"])
+def test_self_recall_after_single_vector_first_upsert(quantization):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((201, 384)).astype(np.float32)
+
+    store = FaissVectorStore(quantization=quantization)
+    # A one-chunk first upsert must not fix the int8 ranges to a single point.
+    store.upsert(_batch(0, vectors[:1]))
+    store.upsert(_batch(1, vectors[1:]))
+
+    hits = [
+        store.query(vec, SearchQuery(query="q", top_k=1))[0].chunk_id
+        for vec in vectors
+    ]
+    recall = np.mean([hit == f"c{i}" for i, hit in enumerate(hits)])
+    assert recall >= 0.99
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from semantic_core.chunking.base import build_default_chunker
+from semantic_core.models import DocumentRef, NormalizedDocument
+from semantic_core.pipelines.indexer import IndexPipeline
+from semantic_core.vectorstores.faiss_store import FaissVectorStore
+
+
+class _Embedder:
+    """Deterministic embedder that fails on the `fail_on`-th call."""
+
+    def __init__(self, fail_on=None):
+        self.calls = 0
+        self.fail_on = fail_on
+
+    def embed_texts(self, texts):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise RuntimeError("embedding failed")
+        rng = np.random.default_rng(len(texts))
+        return rng.standard_normal((len(texts), 8)).astype(np.float32)
+
+
+def _doc() -> NormalizedDocument:
+    ref = DocumentRef("d", "s", "txt", datetime(2024, 1, 1), "ck")
+    return NormalizedDocument(ref=ref, text="hello world. " * 2000)
+
+
+def _pipeline(store, embedder, **kwargs) -> IndexPipeline:
+    return IndexPipeline(
+        chunker=build_default_chunker(),
+        embedder=embedder,
+        store=store,
+        metadata={},
+        batch_size=5,
+        embed_concurrency=1,
+        **kwargs,
+    )
+
+
+def test_failed_run_is_discarded_and_retried():
+    store = FaissVectorStore()
+    with pytest.raises(RuntimeError):
+        asyncio.run(_pipeline(store, _Embedder(fail_on=3)).aindex(_doc()))
+
+    assert not store.has_checksum("ck")
+    assert asyncio.run(_pipeline(store, _Embedder()).aindex(_doc())) > 0
+
+
+def test_failed_reindex_keeps_complete_index():
+    store = FaissVectorStore()
+    written = asyncio.run(_pipeline(store, _Embedder()).aindex(_doc()))
+
+    pipeline = _pipeline(store, _Embedder(fail_on=3), skip_duplicates=False)
+    with pytest.raises(RuntimeError):
+        asyncio.run(pipeline.aindex(_doc()))
+
+    assert len(store._chunks) == written
+
+
+def test_failed_run_only_discards_its_own_chunks():
+    store = FaissVectorStore()
+    written = _pipeline(store, _Embedder()).index(_doc())
+
+    class _FailingStore:
+        def __getattr__(self, name):
+            return getattr(store, name)
+
+        def has_checksum(self, checksum):
+            return False  # raced the first run's check
+
+        def upsert(self, items):
+            raise RuntimeError("upsert failed")
+
+    with pytest.raises(RuntimeError):
+        _pipeline(_FailingStore(), _Embedder()).index(_doc())
+
+    assert len(store._chunks) == written
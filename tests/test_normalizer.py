@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from semantic_core.ingest.normalizer import normalize_and_hash, normalize_text, sha256
+
+
+def _reference(pieces):
+    text = normalize_text("".join(pieces))
+    return text, sha256(text)
+
+
+@pytest.mark.parametrize(
+    "pieces",
+    [
+        [],
+        [""],
+        ["", "", ""],
+        ["a\r", "\nb"],  # \r\n split across pieces
+        ["a\r", "", "\nb"],  # ... with an empty piece in between
+        ["a\r", "b"],  # lone \r at a boundary
+        ["a\r"],  # lone \r at the very end
+        ["\r", "\n", "\r", "\n", "\r\n", "x"],
+        ["a  ", "  b"],  # space run across pieces
+        ["a \t", "", "\t b"],  # mixed run across an empty piece
+        ["a\n", "\n", "\n", "\nb"],  # newline run across pieces
+        ["a \n", " \n ", "\n b"],
+        ["   ", "  lead", "ing"],  # leading whitespace over several pieces
+        ["trail", "ing  ", "  ", "\n\n"],  # trailing whitespace over pieces
+        ["a", " ", "b", " ", "c"],
+        ["\t\r\n ", " \r", "\n\n\n", "x \r", "\n"],
+    ],
+)
+def test_matches_normalize_text_and_sha256(pieces):
+    assert normalize_and_hash(pieces) == _reference(pieces)
+
+
+def test_matches_on_random_splits():
+    rng = random.Random(0)
+    alphabet = ["a", "b", " ", "  ", "\t", "\n", "\r", "\r\n", "é"]
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 6)))
+        pieces = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+        assert normalize_and_hash(pieces) == _reference(pieces), pieces
@@ -0,0 +1,27 @@
+import numpy as np
+
+from semantic_core.vectorstores.query_cache import LSHQueryCache
+
+
+def test_put_after_concurrent_clear_is_dropped():
+    cache = LSHQueryCache(maxsize=8)
+    vector = np.ones(8, dtype=np.float32)
+
+    generation = cache.generation
+    cache.clear()  # a write lands while the search is in flight
+    cache.put(vector, "k", ["stale"], generation=generation)
+
+    assert cache.get(vector, "k") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("semantic_core.vectorstores.query_cache.time.monotonic", lambda: now[0])
+    cache = LSHQueryCache(maxsize=8, ttl=60.0)
+    vector = np.ones(8, dtype=np.float32)
+
+    cache.put(vector, "k", ["hit"], generation=cache.generation)
+    assert cache.get(vector, "k") == ["hit"]
+
+    now[0] += 61.0
+    assert cache.get(vector, "k") is None
@@ -0,0 +1,35 @@
+import json
+import tempfile
+
+import pytest
+
+from semantic_core.ingest.readers import read_json, read_pdf
+
+
+def test_read_json_extracts_text_field():
+    assert read_json(b'{"data": {"text": "hello"}}') == "hello"
+
+
+def test_read_json_deeply_nested():
+    raw = b"[" * 300 + b"1" + b"]" * 300
+    assert json.loads(read_json(raw)) == json.loads(raw)
+
+
+def test_read_json_keeps_wide_integers_and_nan():
+    out = read_json(b'{"n": 123456789012345678901234567890, "x": NaN}')
+    assert "123456789012345678901234567890" in out
+    assert "NaN" in out
+
+
+def test_read_json_invalid_utf8():
+    assert json.loads(read_json(b'{"t": "a\xffb"}')) == {"t": "ab"}
+
+
+def test_read_pdf_from_rolled_over_spool():
+    pymupdf = pytest.importorskip("pymupdf")
+    pdf = pymupdf.open()
+    pdf.new_page().insert_text((72, 72), "hello pdf")
+    with tempfile.SpooledTemporaryFile(max_size=16) as spool:
+        spool.write(pdf.tobytes())
+        spool.seek(0)
+        assert read_pdf(spool).strip() == "hello pdf"